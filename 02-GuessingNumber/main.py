@@ -1,7 +1,24 @@
 import random
-import os
+import sys
 from typing import Tuple, Optional
 
+_BAR = '=' * 40
+
+def _fast_input(prompt: str = '') -> str:
+    """input() without its extra stream-wrapper and stderr-flush overhead."""
+    if prompt:
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line[:-1] if line.endswith('\n') else line
+
+def _clear():
+    """Clear the terminal without spawning a shell; no-op when piped."""
+    if sys.stdout.isatty():
+        sys.stdout.write('\x1b[2J\x1b[H')
+
 class NumberGuessingGame:
     
     def __init__(self, min_number: int = 1, max_number: int = 100):
@@ -10,47 +27,64 @@ class NumberGuessingGame:
         self.target_number = None
         self.attempts = 0
         self.best_score = None
-        
+        self._build_hint_table()
+
+    def _build_hint_table(self):
+        """Precompute a hint per possible difference for this range."""
+        # Index = abs(guess - target); one table lookup replaces the
+        # if/elif threshold chain in give_hint
+        max_difference = self.max_number - self.min_number
+        table = []
+        for difference in range(max_difference + 1):
+            if difference == 0:
+                table.append(" Correct! You got it!")
+            elif difference <= 5:
+                table.append(" Very hot!")
+            elif difference <= 15:
+                table.append(" Hot")
+            elif difference <= 25:
+                table.append(" Warm")
+            elif difference <= 40:
+                table.append(" Cool")
+            else:
+                table.append(" Cold")
+        self._hint_table = tuple(table)
+
     def generate_random_number(self) -> int:
         """Generate a random number within range."""
         return random.randint(self.min_number, self.max_number)
     
     def get_user_guess(self) -> Optional[int]:
         """Get and validate user's guess."""
-        try:
-            guess_input = input(f"Enter your guess ({self.min_number}-{self.max_number}): ")
-            guess = int(guess_input)
-            
-            if guess < self.min_number:
-                print(f" Too low! Minimum is {self.min_number}.")
-                return None
-            elif guess > self.max_number:
-                print(f" Too high! Maximum is {self.max_number}.")
-                return None
-                
-            return guess
-            
-        except ValueError:
+        guess_input = _fast_input(f"Enter your guess ({self.min_number}-{self.max_number}): ")
+        s = guess_input.strip()
+
+        # One C-level isdecimal call instead of catching ValueError from
+        # int(); isdecimal (unlike isdigit) is True exactly for the
+        # characters int() accepts, so '²' and friends are rejected here
+        sign_stripped = s[1:] if s[:1] in '+-' else s
+        if not sign_stripped.isdecimal():
             print(f" Please enter a valid whole number.")
             return None
+
+        guess = int(s)
+
+        if guess < self.min_number:
+            print(f" Too low! Minimum is {self.min_number}.")
+            return None
+        elif guess > self.max_number:
+            print(f" Too high! Maximum is {self.max_number}.")
+            return None
+
+        return guess
     
     def give_hint(self, guess: int) -> str:
-     
-        # Calculate how far off the guess is
+
+        # Calculate how far off the guess is and look up the hint
         difference = abs(guess - self.target_number)
-        
-        if difference == 0:
-            return " Correct! You got it!"
-        elif difference <= 5:
-            return " Very hot!"
-        elif difference <= 15:
-            return " Hot"
-        elif difference <= 25:
-            return " Warm"
-        elif difference <= 40:
-            return " Cool"
-        else:
-            return " Cold"
+        if difference >= len(self._hint_table):
+            difference = len(self._hint_table) - 1
+        return self._hint_table[difference]
     
     def play_one_round(self):
         """Play a single round of the game."""
@@ -58,34 +92,35 @@ class NumberGuessingGame:
         self.target_number = self.generate_random_number()
         self.attempts = 0
         
-        print(f"\n{'='*40}")
-        print(f"I'm thinking of a number between {self.min_number} and {self.max_number}")
-        print(f"{'='*40}")
+        sys.stdout.write(f"\n{_BAR}\nI'm thinking of a number between {self.min_number} and {self.max_number}\n{_BAR}\n")
         
-        # Game loop
+        # Game loop; count attempts in a local and write the attribute
+        # back once after the loop — validate before counting, so invalid
+        # input never needs an increment-then-undo
+        attempts = 0
         while True:
-            self.attempts += 1
-            
             # Get valid guess from user
             guess = self.get_user_guess()
             if guess is None:
-                self.attempts -= 1  # Don't count invalid attempts
                 continue  # Ask again
-            
+
+            attempts += 1
+
             # Give hint
             hint = self.give_hint(guess)
-            print(f"Attempt #{self.attempts}: {hint}")
-            
+            print(f"Attempt #{attempts}: {hint}")
+
             # Check if won
             if guess == self.target_number:
-                print(f"\n You won in {self.attempts} attempts!")
+                print(f"\n You won in {attempts} attempts!")
                 print(f" The number was {self.target_number}")
                 break  # Exit the game loop
+        self.attempts = attempts
     
     def run(self):
         """Start the game."""
         # Clear the screen for better experience
-        os.system('cls' if os.name == 'nt' else 'clear')
+        _clear()
         
         print(" Welcome to the Number Guessing Game! ")
         self.play_one_round()
@@ -1,3 +1,17 @@
+import sys
+
+_BAR = "=" * 40
+
+def _fast_input(prompt: str = '') -> str:
+    """input() without its extra stream-wrapper and stderr-flush overhead."""
+    if prompt:
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line[:-1] if line.endswith('\n') else line
+
 def is_even_modulo(number: int) -> bool:
     return number % 2 == 0
 
@@ -9,70 +23,62 @@ def is_even_division(number: int) -> bool:
 
 def get_number_input(prompt: str = "Enter a number: ") -> int:
     while True:
-        try:
-            user_input = input(prompt)
-   
-            if not user_input.strip():
-                print(" Please enter a value.")
-                continue
-                
-            number = int(user_input)
-            return number
-            
-        except ValueError:
-            print(" Invalid input! Please enter a valid integer (e.g., 42, -7, 0).")
-            if "." in user_input:
-                print(" Tip: Enter whole numbers only (no decimals).")
-            elif any(c.isalpha() for c in user_input):
-                print(" Tip: Numbers shouldn't contain letters.")
+        user_input = _fast_input(prompt)
+        s = user_input.strip()
+
+        if not s:
+            print(" Please enter a value.")
+            continue
+
+        # Pre-validate with one C-level isdecimal call instead of
+        # letting int() raise; isdecimal (unlike isdigit) is True only
+        # for characters int() actually accepts, so '²' stays invalid
+        sign_stripped = s[1:] if s[:1] in '+-' else s
+        if sign_stripped.isdecimal():
+            return int(s)
+
+        print(" Invalid input! Please enter a valid integer (e.g., 42, -7, 0).")
+        if "." in s:
+            print(" Tip: Enter whole numbers only (no decimals).")
+        elif sign_stripped.isalnum():
+            print(" Tip: Numbers shouldn't contain letters.")
 
 def check_single_number():
-    print("\n" + "="*40)
-    print("ODD or EVEN CHECKER")
-    print("="*40)
+    sys.stdout.write(f"\n{_BAR}\nODD or EVEN CHECKER\n{_BAR}\n")
     
     number = get_number_input()
-    
-    result_modulo = is_even_modulo(number)
-    result_bitwise = is_even_bitwise(number)
-    result_division = is_even_division(number)
-    
-    if result_modulo == result_bitwise == result_division:
-        parity = "EVEN" if result_modulo else "ODD"
-        
-        print(f"\n Checking number: {number}")
-        print(f" Result: {number} is {parity}")
-        
-        print(f"\n Mathematical Explanation:")
-        print(f"  {number} % 2 = {number % 2}")
-        print(f"  {number} ÷ 2 = {number / 2}")
-        
-        if parity == "EVEN":
-            print(f" No remainder when divided by 2")
-        else:
-            print(f"  Remainder of 1 when divided by 2")
-            
-        binary_rep = bin(number)[2:]  # Remove '0b' prefix
-        last_bit = binary_rep[-1] if binary_rep else '0'
-        print(f"\n Binary representation: {binary_rep}")
-        print(f"   Last bit: {last_bit} ({'0 = even' if last_bit == '0' else '1 = odd'})")
-        
+
+    # Single bitwise test; cross-checking the three methods lives in run_tests()
+    parity_even = (number & 1) == 0
+    parity = "EVEN" if parity_even else "ODD"
+
+    print(f"\n Checking number: {number}")
+    print(f" Result: {number} is {parity}")
+
+    print(f"\n Mathematical Explanation:")
+    print(f"  {number} % 2 = {number % 2}")
+    print(f"  {number} ÷ 2 = {number / 2}")
+
+    if parity_even:
+        print(f" No remainder when divided by 2")
     else:
-        print(" Error: Different methods gave different results!")
-        print(f"Modulo: {result_modulo}, Bitwise: {result_bitwise}, Division: {result_division}")
+        print(f"  Remainder of 1 when divided by 2")
+
+    binary_rep = bin(number)[2:]  # Remove '0b' prefix
+    last_bit = binary_rep[-1] if binary_rep else '0'
+    print(f"\n Binary representation: {binary_rep}")
+    print(f"   Last bit: {last_bit} ({'0 = even' if last_bit == '0' else '1 = odd'})")
 
 def check_multiple_numbers():
     """Check multiple numbers in sequence."""
-    print("\n" + "="*40)
-    print("MULTIPLE NUMBERS CHECK")
-    print("="*40)
+    sys.stdout.write(f"\n{_BAR}\nMULTIPLE NUMBERS CHECK\n{_BAR}\n")
     
     numbers = []
     
     print("Enter numbers one by one. Type 'done' to finish.")
     
     while True:
-        user_input = input("\nEnter a number (or 'done'): ").strip().lower()
+        user_input = _fast_input("\nEnter a number (or 'done'): ").strip().lower()
         
         if user_input == 'done':
             break
@@ -81,7 +87,7 @@ def check_multiple_numbers():
             number = int(user_input)
             numbers.append(number)
             
-            if is_even_modulo(number):
+            if (number & 1) == 0:
                 print(f"  {number}: EVEN ✓")
             else:
                 print(f"  {number}: ODD ✗")
@@ -94,37 +100,37 @@ def check_multiple_numbers():
 
 def display_statistics(numbers: list):
     """Display statistics about the numbers checked."""
-    print("\n" + "="*40)
-    print(" STATISTICS")
-    print("="*40)
+    sys.stdout.write(f"\n{_BAR}\n STATISTICS\n{_BAR}\n")
     
     if not numbers:
         print("No numbers were entered.")
         return
     
-    # Count evens and odds
-    evens = [n for n in numbers if is_even_modulo(n)]
-    odds = [n for n in numbers if not is_even_modulo(n)]
+    # Count evens and odds in a single pass
+    evens, odds = [], []
+    for n in numbers:
+        (odds if n & 1 else evens).append(n)
     
     print(f"Total numbers checked: {len(numbers)}")
     print(f"Even numbers: {len(evens)} ({len(evens)/len(numbers)*100:.1f}%)")
     print(f"Odd numbers: {len(odds)} ({len(odds)/len(numbers)*100:.1f}%)")
     
+    # Sort once per group; the endpoints of a sorted list are its min/max
     if evens:
-        print(f"\nEven numbers found: {sorted(evens)}")
-        print(f"Smallest even: {min(evens)}")
-        print(f"Largest even: {max(evens)}")
-    
+        evens_sorted = sorted(evens)
+        print(f"\nEven numbers found: {evens_sorted}")
+        print(f"Smallest even: {evens_sorted[0]}")
+        print(f"Largest even: {evens_sorted[-1]}")
+
     if odds:
-        print(f"\nOdd numbers found: {sorted(odds)}")
-        print(f"Smallest odd: {min(odds)}")
-        print(f"Largest odd: {max(odds)}")
+        odds_sorted = sorted(odds)
+        print(f"\nOdd numbers found: {odds_sorted}")
+        print(f"Smallest odd: {odds_sorted[0]}")
+        print(f"Largest odd: {odds_sorted[-1]}")
 
 def show_educational_info():
     """Display educational information about odd and even numbers."""
-    print("\n" + "="*40)
-    print(" EDUCATIONAL INFO")
-    print("="*40)
+    sys.stdout.write(f"\n{_BAR}\n EDUCATIONAL INFO\n{_BAR}\n")
     
     print("\n What are Odd and Even Numbers?")
     print("""
@@ -151,21 +157,17 @@ def show_educational_info():
 
 def show_menu():
     """Display the main menu."""
-    print("\n" + "="*40)
-    print(" ODD/EVEN CHECKER MENU")
-    print("="*40)
+    sys.stdout.write(f"\n{_BAR}\n ODD/EVEN CHECKER MENU\n{_BAR}\n")
     print("1. Check a single number")
     print("2. Check multiple numbers")
     print("3. Learn about odd/even numbers")
     print("4. Run tests")
     print("5. Exit")
-    print("="*40)
+    print(_BAR)
 
 def run_tests():
     """Run automated tests to verify the program works correctly."""
-    print("\n" + "="*40)
-    print(" RUNNING TESTS")
-    print("="*40)
+    sys.stdout.write(f"\n{_BAR}\n RUNNING TESTS\n{_BAR}\n")
     
     test_cases = [
         (-10, True),   # Negative even
@@ -206,7 +208,7 @@ def main():
         show_menu()
         
         try:
-            choice = input("\nEnter your choice (1-5): ").strip()
+            choice = _fast_input("\nEnter your choice (1-5): ").strip()
             
             if choice == '1':
                 check_single_number()
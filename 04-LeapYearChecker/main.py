@@ -1,5 +1,13 @@
+# Leap years repeat with a 400-year cycle, so pack the whole cycle into
+# one 400-bit mask built once at import; each check is then a single
+# shift-and-test instead of three modulos
+_LEAP_MASK = 0
+for _y in range(400):
+    if _y % 4 == 0 and (_y % 100 != 0 or _y % 400 == 0):
+        _LEAP_MASK |= 1 << _y
+
 def is_leap_year(year: int) -> bool:
-    return (year % 4 == 0) and (year % 100 != 0 or year % 400 == 0)
+    return bool((_LEAP_MASK >> (year % 400)) & 1)
 
 def get_valid_year() -> int:
     while True:
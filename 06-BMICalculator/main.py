@@ -1,16 +1,21 @@
+import bisect
+
+import numpy as np
+
+# Classification is a binary search over the cutoffs instead of an
+# if/elif chain, which also vectorizes for arrays of BMIs
+_BMI_CUT = (18.5, 25.0, 30.0)
+_BMI_LAB = ("Underweight", "Normal", "Overweight", "Obese")
+
 def calculate_bmi(weight: float, height: float) -> float:
     return weight / (height **2)
 
 def classify_bmi(bmi: float) -> str:
-    
-    if bmi < 18.5:
-        return "Underweight"
-    elif bmi < 25:
-        return "Normal"
-    elif bmi < 30:
-        return "Overweight"
-    else:
-        return "Obese"
+    return _BMI_LAB[bisect.bisect_right(_BMI_CUT, bmi)]
+
+def classify_bmi_array(bmis) -> np.ndarray:
+    """Classify a whole array of BMIs in one vectorized call."""
+    return np.asarray(_BMI_LAB)[np.searchsorted(_BMI_CUT, bmis, side='right')]
 
 def main():
     print(" ==== BMI ==== ")
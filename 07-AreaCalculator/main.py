@@ -1,14 +1,16 @@
-import math
+# Bound once at import so circle_area skips the math.pi attribute
+# lookup on every call
+from math import pi as _PI
 
 
 def circle_area(radius: float) -> float:
-    return math.pi * radius * radius
+    return _PI * radius * radius
 
 def rectangle_area(length: float, width: float) -> float:
     return length * width
 
 def triangle_area(base: float, height: float) -> float:
-    return 0.5 * base * height
+    return base * height * 0.5
 
 def main():
     print("Area Calculator")
@@ -1,13 +1,31 @@
+import sys
+
+def _fast_input(prompt: str = '') -> str:
+    """input() without its extra stream-wrapper and stderr-flush overhead."""
+    if prompt:
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line[:-1] if line.endswith('\n') else line
+
 class SimpleTod:
     def __init__(self):
-        self.tasks =[]
-        self.next_id =1
+        # Structure-of-arrays layout: parallel lists share one index,
+        # with done stored as one byte per task
+        self.ids = []
+        self.descriptions = []
+        self.done = bytearray()
+        self.id_to_index = {}
+        self.next_id = 1
 
     def add(self, description: str):
         if description.strip():
-            task = {"id":self.next_id, "description":description, "done":False}
-            
-            self.tasks.append(task)
+            self.id_to_index[self.next_id] = len(self.ids)
+            self.ids.append(self.next_id)
+            self.descriptions.append(description)
+            self.done.append(0)
             self.next_id += 1
             print(f"Added:{description}")
         else:
@@ -15,50 +33,55 @@ class SimpleTod:
 
     def view(self):
 
-        if not self.tasks:
+        if not self.ids:
             print("No tasks")
             return
-        
+
         print("\n Your Tasks: ")
-        for task in self.tasks:
-            status = "Yes" if task["done"] else "No"
-            print(f"{task['id']}. [{status}] {task['description']}")
+        for task_id, description, done in zip(self.ids, self.descriptions, self.done):
+            status = "Yes" if done else "No"
+            print(f"{task_id}. [{status}] {description}")
 
     def complete(self, task_id: int):
-        for task in self.tasks:
-            if task_id['id'] == task_id:
-                task["done"] = True
-                print(f" Completed task {task_id}")
-                return
+        index = self.id_to_index.get(task_id)
+        if index is not None:
+            self.done[index] = 1
+            print(f" Completed task {task_id}")
+            return
         print(f" Task{task_id} not found")
 
     def delete(self, task_id: int):
-        for task in self.tasks:
-            if task['id'] == task_id:
-                self.tasks.remove(task)
-                print(f"Deleted task {task_id}")
-                return
+        index = self.id_to_index.pop(task_id, None)
+        if index is not None:
+            self.ids.pop(index)
+            self.descriptions.pop(index)
+            del self.done[index]
+            # Tasks after the removed one shift down by one slot
+            for i in range(index, len(self.ids)):
+                self.id_to_index[self.ids[i]] = i
+            print(f"Deleted task {task_id}")
+            return
         print(f"Task {task_id} not found")
 
 def main():
     todo =  SimpleTod()
     while True:
         print("\n1. Add 2. View 3. complete 4. Delete 5. Exit")
-        choice = input("Choose: ").strip()
+        choice = _fast_input("Choose: ").strip()
         if choice == "1":
-           task =input("Task: ").strip()
+           task =_fast_input("Task: ").strip()
            todo.add(task)
         elif choice == "2":
             todo.view()
         elif choice == "3":
             try:
-                task_id = int(input("Task ID to complete: "))
+                task_id = int(_fast_input("Task ID to complete: "))
                 todo.complete(task_id)
             except:
                 print("Enter a number")
         elif choice == "4":
             try:
-                task_id = int(input("Task ID to delete: "))
+                task_id = int(_fast_input("Task ID to delete: "))
                 todo.delete(task_id)
             except:
                 print("Enter a number")
@@ -69,4 +92,4 @@ def main():
             print("Choose 1-5")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
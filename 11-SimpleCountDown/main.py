@@ -1,13 +1,19 @@
+import sys
 import time
 
 def countdown(seconds: int):
     print(f"Starting {seconds} second timer...\n")
 
-    for i in range(seconds, 0, -1):
-        mins, secs = divmod(i, 60)
-        timer = f"{mins:02d}:{secs:02d}"
-        print(f"Time remaining: {timer}", end='\r')
-        time.sleep(1)
+    # Sleep against absolute deadlines from one monotonic start time,
+    # so format/print cost never accumulates into drift
+    start = time.monotonic()
+
+    for k in range(seconds):
+        remaining = seconds - k
+        mins, secs = divmod(remaining, 60)
+        sys.stdout.write(f"\rTime remaining: {mins:02d}:{secs:02d}")
+        sys.stdout.flush()
+        time.sleep(max(0, start + (k + 1) - time.monotonic()))
     print("\n TIME'S UP!")
 
 def main():
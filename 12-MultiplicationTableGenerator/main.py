@@ -1,3 +1,5 @@
+import sys
+
 num = int(input("Enter number: "))
 
 print("\nChoose table type:")
@@ -7,21 +9,27 @@ print("3. Reverse table")
 
 choice = input("Choice (1-3): ")
 
+# Build each table as one string and emit it with a single write,
+# instead of one print (and flush) per row
+
 if choice == "1":
 
     print(f"\n Table of {num}: ")
-    for i in range (1, 11):
-        print(f"{num} x {i:2} = {num * i:3}")
+    rows = [f"{num} x {i:2} = {num * i:3}" for i in range(1, 11)]
+    sys.stdout.write('\n'.join(rows))
+    sys.stdout.write('\n')
 
 elif choice == "2":
     start = int(input("Start from: "))
     end = int(input("End at: "))
 
     print(f"\n Table of {num} ({start} to {end}): ")
-    for i in range(start, end + 1):
-        print(f"{num} x {i:2} = {num * i:3}")
+    rows = [f"{num} x {i:2} = {num * i:3}" for i in range(start, end + 1)]
+    sys.stdout.write('\n'.join(rows))
+    sys.stdout.write('\n')
 
 elif choice == "3":
     print(f"\n Reverse Table of {num}:")
-    for i in range(10, 0, -1):
-        print(f"{num} x {i:2} = {num * i:3}")
\ No newline at end of file
+    rows = [f"{num} x {i:2} = {num * i:3}" for i in range(10, 0, -1)]
+    sys.stdout.write('\n'.join(rows))
+    sys.stdout.write('\n')
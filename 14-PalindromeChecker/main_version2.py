@@ -1,6 +1,17 @@
 def is_palindrome(text: str)-> bool:
-    cleaned = ''.join(char.lower() for char in text if char.isalnum())
-    return cleaned == cleaned[::-1]
+    # Two-pointer scan: no cleaned copy, no reversed copy, and it
+    # short-circuits on the first mismatch
+    i, j = 0, len(text) - 1
+    while i < j:
+        while i < j and not text[i].isalnum():
+            i += 1
+        while i < j and not text[j].isalnum():
+            j -= 1
+        if text[i].lower() != text[j].lower():
+            return False
+        i += 1
+        j -= 1
+    return True
 
 
 def main():
@@ -1,15 +1,15 @@
 import math  # Import Python's math toolbox
+from functools import lru_cache  # Memoization decorator
+
+_BAR = "=" * 40   # Banner strings built once at import
+_DASH = "-" * 40
 
 def factorial_loop(n):
-    result = 1           # Start with 1 (identity for multiplication)
-    steps = []           # Empty list to store each step
-    
-    for i in range(1, n+1):      # For i = 1, 2, 3, ..., n
-        result *= i               # Multiply: result = result × i
-        steps.append(f"× {i}")    # Save step as string "× 1", "× 2", etc.
-    
-    return result, steps         # Return TWO values: (result, steps list)
+    # math.factorial runs in C; the steps are returned as a lazy range
+    # and only formatted at print time, so no per-step strings are built
+    return math.factorial(n), range(1, n + 1)
 
+@lru_cache(maxsize=None)  # Cache results so repeated calls are O(1)
 def factorial_recursive(n):
     if n <= 1:                    # BASE CASE: n=0 or n=1
         return 1                  # Return 1 immediately
@@ -17,7 +17,7 @@ def factorial_recursive(n):
 
 def main():
     print(" FACTORIAL CALCULATOR")  # Title
-    print("="*40)                     # Separator line
+    print(_BAR)                       # Separator line
     
     try:  # Try to run this code, catch errors if they happen
         n = int(input("Enter a number: "))  # Convert input to integer
@@ -26,25 +26,28 @@ def main():
             print(" Factorial not defined for negative numbers!")
             return  # Exit function early
         print("\n CALCULATION METHODS:")
-        print("-"*40)
+        print(_DASH)
         
-        # Method 1: Built-in (simplest)
+        # Method 1: Built-in (simplest) — computed once, reused below
+        f = math.factorial(n)
         print("1. Built-in (math.factorial):")
-        print(f"   {math.factorial(n):,}")  # :, adds commas (1,000)
+        print(f"   {f:,}")  # :, adds commas (1,000)
                 # Method 2: Loop (show steps)
         print("\n2. Loop method:")
         result, steps = factorial_loop(n)  # Get BOTH return values
-        
-        # Build step string: "1 × 1 × 2 × 3 × 4 × 5"
-        steps_str = "1 " + " ".join(steps)  # Join steps with spaces
-        
-        print(f"   {steps_str} = {result:,}")  # Show full calculation
+
+        # Build step string only for small n: "1 × 1 × 2 × 3 × 4 × 5"
+        if n <= 20:
+            steps_str = "1 × " + " × ".join(map(str, steps))
+            print(f"   {steps_str} = {result:,}")  # Show full calculation
+        else:
+            print(f"   (steps omitted for large n) = {result:,}")
                 # Method 3: Recursive
         print("\n3. Recursive method:")
         print(f"   {factorial_recursive(n):,}")
         
-        print("-"*40)
-        print(f" {n}! = {math.factorial(n):,}")
+        print(_DASH)
+        print(f" {n}! = {f:,}")
 
     except ValueError:  # If int() conversion fails
         print(" Please enter a valid integer!")
@@ -2,12 +2,14 @@ def fibonacci_method1(n: int):
 
     if n <= 0:
         return []
-    
-    sequence = []
+
+    # Preallocate and assign by index: no per-append over-allocation
+    # or method dispatch inside the loop
+    sequence = [0] * n
     a, b = 0, 1
 
     for i in range(n):
-        sequence.append(a)
+        sequence[i] = a
         a, b = b, a + b
 
     return sequence
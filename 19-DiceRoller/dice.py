@@ -1,6 +1,13 @@
-import random
+import array
 from typing import List, Tuple, Dict, Optional
 
+import numpy as np
+
+# One shared PCG64 generator for every Dice: batched draws run in
+# vectorized C with Lemire-style bounded reduction, and sharing keeps
+# the generator's internal buffer hot across instances
+_RNG = np.random.Generator(np.random.PCG64())
+
 
 class Dice:
     """A class representing a single die with configurable sides."""
@@ -16,54 +23,82 @@ class Dice:
         100: "D100"
     }
     
-    def __init__(self, sides: int = 6, name: Optional[str] = None):
+    def __init__(self, sides: int = 6, name: Optional[str] = None,
+                 track_history: bool = True):
         """
         Initialize a dice with specified number of sides.
-        
+
         Args:
             sides (int): Number of sides on the dice (default: 6)
             name (str, optional): Custom name for the dice
+            track_history (bool): Keep a per-dice roll history (default: True)
         """
         if sides < 2:
             raise ValueError("Dice must have at least 2 sides")
-        
+
         self.sides = sides
         self.name = name or self.DICE_TYPES.get(sides, f"D{sides}")
-        self._history = []
-        
+        self.track_history = track_history
+        # Packed C ints: 4 bytes per roll instead of a boxed Python
+        # int object per entry
+        self._history = array.array('i')
+
+    @classmethod
+    def seed(cls, seed: int) -> None:
+        """Reseed the shared generator; all Dice share one RNG stream,
+        so this makes every subsequent roll deterministic."""
+        global _RNG
+        _RNG = np.random.Generator(np.random.PCG64(seed))
+
     def roll(self) -> int:
         """
         Roll the dice once.
-        
+
         Returns:
             int: Random number between 1 and number of sides
         """
-        result = random.randint(1, self.sides)
-        self._history.append(result)
+        result = int(_RNG.integers(1, self.sides + 1))
+        if self.track_history:
+            self._history.append(result)
         return result
-    
+
     def roll_multiple(self, times: int = 1) -> List[int]:
         """
         Roll the dice multiple times.
-        
+
         Args:
             times (int): Number of rolls
-            
+
         Returns:
             List[int]: List of roll results
         """
         if times < 1:
             raise ValueError("Number of rolls must be at least 1")
-        
-        return [self.roll() for _ in range(times)]
+
+        # Draw the whole batch in one vectorized call instead of one
+        # interpreter round-trip per roll
+        results = _RNG.integers(
+            1, self.sides + 1, size=times, dtype=np.int64
+        ).tolist()
+        if self.track_history:
+            self._history.extend(results)
+        return results
     
     def get_history(self) -> List[int]:
         """Get the history of all rolls for this dice."""
-        return self._history.copy()
+        return list(self._history)
+
+    def history_sum(self) -> int:
+        """Sum of all rolls without copying the history."""
+        return sum(self._history)
+
+    def history_len(self) -> int:
+        """Number of recorded rolls without copying the history."""
+        return len(self._history)
     
     def clear_history(self) -> None:
         """Clear the roll history."""
-        self._history.clear()
+        del self._history[:]
     
     def get_average(self) -> float:
         """Calculate average of all rolls."""
@@ -1,4 +1,5 @@
 import sys
+import re
 import argparse
 from typing import Optional
 
@@ -7,37 +8,73 @@ from dice import Dice, DiceSet
 from visualizer import DiceVisualizer
 from statistics import StatisticsTracker
 
+# Compiled once; one linear scan extracts every "<count>d<sides>" term
+_DICE_RE = re.compile(r"(\d+)d(\d+)")
+
 
 class DiceRollerApp:
     """Main application class for Dice Rolling Simulator."""
-    
+
+    # Menu text is constant; build it once instead of looping per prompt
+    MAIN_MENU = "\n".join([
+        "",
+        "-" * 30,
+        "MAIN MENU",
+        "-" * 30,
+        "1. Roll a single dice",
+        "2. Roll multiple dice",
+        "3. Roll custom combination",
+        "4. Show statistics",
+        "5. Export statistics",
+        "6. Clear statistics",
+        "0. Exit",
+    ])
+    DICE_TYPES_MENU = "\n".join(
+        f"  {name} (d{sides})" for sides, name in Dice.DICE_TYPES.items()
+    )
+
     def __init__(self):
         self.stats_tracker = StatisticsTracker()
-        self.dice_set = DiceSet()
-        self.setup_default_dice()
-        
+        self._dice_set: Optional[DiceSet] = None
+
+    @property
+    def dice_set(self) -> DiceSet:
+        """Default dice set, built on first access.
+
+        CLI paths like --stats/--export never touch it, so they skip
+        the six Dice allocations entirely.
+        """
+        if self._dice_set is None:
+            self._dice_set = DiceSet()
+            self.setup_default_dice()
+        return self._dice_set
+
     def setup_default_dice(self) -> None:
         """Setup some default dice."""
         for sides in [4, 6, 8, 10, 12, 20]:
-            self.dice_set.add_dice(Dice(sides))
+            self._dice_set.add_dice(Dice(sides))
     
     def roll_single_dice(self, sides: int, times: int = 1, show_ascii: bool = True) -> None:
         """Roll a single dice multiple times."""
         dice = Dice(sides)
         
         print(f"\n🎲 Rolling {dice.name} {times} time{'s' if times > 1 else ''}...")
-        
-        for i in range(times):
-            result = dice.roll()
-            self.stats_tracker.add_record(dice, result)
-            
-            if show_ascii:
-                DiceVisualizer.display_generic(dice, result)
-            else:
-                print(f"Roll {i+1}: {result}")
-        
+
+        # One batched draw, one bulk stats append, one joined write —
+        # the results are traversed once instead of once per concern
+        results = dice.roll_multiple(times)
+        self.stats_tracker.add_records(dice, results)
+
+        if show_ascii:
+            out = [DiceVisualizer.render_generic(dice, r) for r in results]
+        else:
+            out = [f"Roll {i}: {r}\n" for i, r in enumerate(results, 1)]
+
+        sys.stdout.write("".join(out))
+        sys.stdout.flush()
+
         if times > 1:
-            print(f"\n📊 Summary: Total={sum(dice.get_history())}, "
+            print(f"\n📊 Summary: Total={dice.history_sum()}, "
                   f"Average={dice.get_average():.2f}")
     
     def roll_custom_dice(self, dice_definitions: list, show_ascii: bool = True) -> None:
@@ -48,10 +85,9 @@ class DiceRollerApp:
         for i, (sides, count) in enumerate(dice_definitions):
             dice = Dice(sides)
             results = dice.roll_multiple(count)
-            
-            for result in results:
-                self.stats_tracker.add_record(dice, result)
-            
+
+            self.stats_tracker.add_records(dice, results)
+
             total += sum(results)
             print(f"\n{dice.name} (x{count}): {results}")
             
@@ -127,22 +163,12 @@ class DiceRollerApp:
     
     def print_menu(self) -> None:
         """Print the main menu."""
-        print("\n" + "-"*30)
-        print("MAIN MENU")
-        print("-"*30)
-        print("1. Roll a single dice")
-        print("2. Roll multiple dice")
-        print("3. Roll custom combination")
-        print("4. Show statistics")
-        print("5. Export statistics")
-        print("6. Clear statistics")
-        print("0. Exit")
+        print(self.MAIN_MENU)
     
     def handle_single_roll(self) -> None:
         """Handle single dice roll in interactive mode."""
         print("\nAvailable dice types:")
-        for sides, name in Dice.DICE_TYPES.items():
-            print(f"  {name} (d{sides})")
+        print(self.DICE_TYPES_MENU)
         
         try:
             sides = int(input("\nEnter number of sides: "))
@@ -164,15 +190,16 @@ class DiceRollerApp:
             sides = int(input("\nEnter number of sides: "))
             count = int(input("How many dice? "))
             
-            dice = Dice(sides)
+            # Results go straight to the stats tracker; no need for the
+            # dice to keep its own copy
+            dice = Dice(sides, track_history=False)
             results = dice.roll_multiple(count)
-            
+
             print(f"\n🎲 Rolling {count} {dice.name}(s)...")
             print(f"Results: {results}")
             print(f"Total: {sum(results)}")
-            
-            for result in results:
-                self.stats_tracker.add_record(dice, result)
+
+            self.stats_tracker.add_records(dice, results)
                 
         except ValueError:
             print("❌ Please enter valid numbers.")
@@ -243,8 +270,14 @@ Examples:
         app.export_statistics(args.export)
     elif args.combination:
         # Parse dice combination like "2d6+1d20"
-        # Implementation left as exercise
-        print("Dice combination feature coming soon!")
+        dice_defs = [
+            (int(sides), int(count))
+            for count, sides in _DICE_RE.findall(args.combination)
+        ]
+        if dice_defs:
+            app.roll_custom_dice(dice_defs, not args.no_ascii)
+        else:
+            print(f"❌ Could not parse combination: {args.combination}")
     elif args.sides:
         app.roll_single_dice(args.sides, args.times, not args.no_ascii)
     else:
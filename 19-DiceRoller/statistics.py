@@ -1,8 +1,22 @@
 import json
+import time
 from typing import List, Dict, Any
-from datetime import datetime
-from dataclasses import dataclass, asdict
-from collections import defaultdict
+from datetime import datetime, timedelta
+from dataclasses import dataclass
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba not installed: fall back to plain CPython execution
+    def njit(*args, **kwargs):
+        return lambda f: f
 
 
 @dataclass
@@ -12,68 +26,208 @@ class RollRecord:
     dice_type: str
     sides: int
     result: int
-    
-    
+
+
+@njit(cache=True)
+def _aggregate(type_ids, results, n, n_types):
+    """Single compiled pass computing count/sum/min/max per dice type."""
+    counts = np.zeros(n_types, np.int64)
+    sums = np.zeros(n_types, np.int64)
+    mins = np.full(n_types, np.iinfo(np.int64).max, np.int64)
+    maxs = np.full(n_types, np.iinfo(np.int64).min, np.int64)
+
+    for i in range(n):
+        t = type_ids[i]
+        r = results[i]
+        counts[t] += 1
+        sums[t] += r
+        if r < mins[t]:
+            mins[t] = r
+        if r > maxs[t]:
+            maxs[t] = r
+
+    return counts, sums, mins, maxs
+
+
 class StatisticsTracker:
-    """Tracks statistics for dice rolls."""
-    
-    def __init__(self):
-        self.records: List[RollRecord] = []
+    """Tracks statistics for dice rolls.
+
+    Rolls are stored column-wise in parallel arrays (sides, result,
+    dice-type id) instead of one RollRecord object per roll; records
+    are only materialized as dataclasses on demand.
+    """
+
+    _INITIAL_CAPACITY = 1024
+
+    def __init__(self, record_timestamps: bool = True):
+        self._record_timestamps = record_timestamps
+        self._sides = np.empty(self._INITIAL_CAPACITY, np.int32)
+        self._results = np.empty(self._INITIAL_CAPACITY, np.int32)
+        self._type_ids = np.empty(self._INITIAL_CAPACITY, np.int32)
+        self._timestamps_ns = np.empty(self._INITIAL_CAPACITY, np.int64)
+        self._n = 0
+        self._type_names: List[str] = []
+        self._name_to_id: Dict[str, int] = {}
         self._session_start = datetime.now()
-        
+        self._t0_mono = time.perf_counter_ns()
+
+    def _materialized_timestamps(self) -> List[str]:
+        """Per-roll timestamps, interpolated when capture was disabled."""
+        if self._record_timestamps:
+            # Convert the monotonic int64 stamps to wall-clock ISO strings
+            # only now; add_record never formats anything
+            return [
+                (self._session_start + timedelta(
+                    microseconds=(int(ns) - self._t0_mono) / 1000
+                )).isoformat()
+                for ns in self._timestamps_ns[:self._n]
+            ]
+        if self._n == 0:
+            return []
+        # Spread the rolls evenly across the session so far
+        interval = (datetime.now() - self._session_start) / self._n
+        return [
+            (self._session_start + i * interval).isoformat()
+            for i in range(self._n)
+        ]
+
+    @property
+    def records(self) -> List[RollRecord]:
+        """Materialize the columnar storage as RollRecord objects."""
+        timestamps = self._materialized_timestamps()
+        return [
+            RollRecord(
+                timestamp=timestamps[i],
+                dice_type=self._type_names[self._type_ids[i]],
+                sides=int(self._sides[i]),
+                result=int(self._results[i]),
+            )
+            for i in range(self._n)
+        ]
+
     def add_record(self, dice: 'Dice', result: int) -> None:
         """Add a roll record to the statistics."""
-        record = RollRecord(
-            timestamp=datetime.now().isoformat(),
-            dice_type=dice.name,
-            sides=dice.sides,
-            result=result
-        )
-        self.records.append(record)
-    
+        if self._n == len(self._results):
+            # Grow geometrically so appends stay amortized O(1)
+            capacity = len(self._results) * 2
+            self._sides = np.resize(self._sides, capacity)
+            self._results = np.resize(self._results, capacity)
+            self._type_ids = np.resize(self._type_ids, capacity)
+            self._timestamps_ns = np.resize(self._timestamps_ns, capacity)
+
+        type_id = self._name_to_id.get(dice.name)
+        if type_id is None:
+            type_id = len(self._type_names)
+            self._name_to_id[dice.name] = type_id
+            self._type_names.append(dice.name)
+
+        self._sides[self._n] = dice.sides
+        self._results[self._n] = result
+        self._type_ids[self._n] = type_id
+        if self._record_timestamps:
+            # One clock read, no datetime object or string per roll
+            self._timestamps_ns[self._n] = time.perf_counter_ns()
+        self._n += 1
+
+    def add_records(self, dice: 'Dice', results) -> None:
+        """Add a whole batch of rolls for one dice in a single append."""
+        n = len(results)
+        if n == 0:
+            return
+
+        capacity = len(self._results)
+        if self._n + n > capacity:
+            while capacity < self._n + n:
+                capacity *= 2
+            self._sides = np.resize(self._sides, capacity)
+            self._results = np.resize(self._results, capacity)
+            self._type_ids = np.resize(self._type_ids, capacity)
+            self._timestamps_ns = np.resize(self._timestamps_ns, capacity)
+
+        type_id = self._name_to_id.get(dice.name)
+        if type_id is None:
+            type_id = len(self._type_names)
+            self._name_to_id[dice.name] = type_id
+            self._type_names.append(dice.name)
+
+        end = self._n + n
+        self._sides[self._n:end] = dice.sides
+        self._results[self._n:end] = results
+        self._type_ids[self._n:end] = type_id
+        if self._record_timestamps:
+            # One clock read for the whole batch
+            self._timestamps_ns[self._n:end] = time.perf_counter_ns()
+        self._n = end
+
     def get_session_stats(self) -> Dict[str, Any]:
         """Get statistics for the current session."""
-        if not self.records:
-            return {"total_rolls": 0}
-        
         stats = {
-            "total_rolls": len(self.records),
+            "total_rolls": self._n,
             "session_duration": str(datetime.now() - self._session_start),
             "session_start": self._session_start.isoformat(),
         }
-        
-        # Group by dice type
-        by_dice_type = defaultdict(list)
-        for record in self.records:
-            by_dice_type[record.dice_type].append(record.result)
-        
+
+        if self._n == 0:
+            return stats
+
+        counts, sums, mins, maxs = _aggregate(
+            self._type_ids, self._results, self._n, len(self._type_names)
+        )
+
         dice_stats = {}
-        for dice_type, results in by_dice_type.items():
+        for type_id, dice_type in enumerate(self._type_names):
+            count = int(counts[type_id])
+            if count == 0:
+                continue
             dice_stats[dice_type] = {
-                "count": len(results),
-                "average": sum(results) / len(results),
-                "min": min(results),
-                "max": max(results),
+                "count": count,
+                "average": int(sums[type_id]) / count,
+                "min": int(mins[type_id]),
+                "max": int(maxs[type_id]),
             }
-        
+
         stats["dice_types"] = dice_stats
         return stats
-    
+
     def export_to_json(self, filename: str = "dice_stats.json") -> None:
         """Export statistics to a JSON file."""
+        timestamps = self._materialized_timestamps()
         data = {
             "session_info": {
                 "start": self._session_start.isoformat(),
                 "end": datetime.now().isoformat(),
-                "total_rolls": len(self.records)
+                "total_rolls": self._n
             },
-            "records": [asdict(record) for record in self.records]
+            # Built straight from the columns; tolist() unboxes each
+            # column to native ints in one C pass instead of per-element
+            # numpy-scalar conversions
+            "records": [
+                {
+                    "timestamp": timestamp,
+                    "dice_type": self._type_names[type_id],
+                    "sides": sides,
+                    "result": result,
+                }
+                for timestamp, type_id, sides, result in zip(
+                    timestamps,
+                    self._type_ids[:self._n].tolist(),
+                    self._sides[:self._n].tolist(),
+                    self._results[:self._n].tolist(),
+                )
+            ]
         }
-        
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2)
-    
+
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(data, f, indent=2)
+
     def clear_stats(self) -> None:
         """Clear all statistics."""
-        self.records.clear()
-        self._session_start = datetime.now()
\ No newline at end of file
+        self._n = 0
+        self._type_names.clear()
+        self._name_to_id.clear()
+        self._session_start = datetime.now()
+        self._t0_mono = time.perf_counter_ns()
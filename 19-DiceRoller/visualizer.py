@@ -1,3 +1,6 @@
+import sys
+
+
 class DiceVisualizer:
     """Creates ASCII art representations of dice rolls."""
     
@@ -47,6 +50,9 @@ class DiceVisualizer:
         ],
     }
     
+    # Faces joined once at class definition; display_d6 just indexes
+    D6_ART_STR = {k: "\n".join(v) + "\n" for k, v in D6_ART.items()}
+
     # Simple text representation for other dice types
     OTHER_DICE_TEMPLATE = [
         "┌──────────────┐",
@@ -56,6 +62,12 @@ class DiceVisualizer:
         "│              │",
         "└──────────────┘",
     ]
+
+    # Joined once at class definition as a %-format string; the % operator
+    # skips the per-call format-spec parsing str.format does per line
+    _TEMPLATE_STR = "\n".join(OTHER_DICE_TEMPLATE).replace(
+        "{sides:2d}", "%2d"
+    ).replace("{result:3d}", "%3d")
     
     @staticmethod
     def display_d6(result: int) -> None:
@@ -65,27 +77,36 @@ class DiceVisualizer:
         Args:
             result (int): Roll result (1-6)
         """
-        if result not in range(1, 7):
-            print(f"Rolled: {result}")
-            return
-            
-        print("\n".join(DiceVisualizer.D6_ART[result]))
+        art = DiceVisualizer.D6_ART_STR.get(result)
+        sys.stdout.write(art if art is not None else f"Rolled: {result}\n")
         
+    @staticmethod
+    def render_generic(dice: 'Dice', result: int) -> str:
+        """
+        Build the ASCII representation of a roll as a string.
+
+        Args:
+            dice (Dice): The dice object
+            result (int): Roll result
+
+        Returns:
+            str: Newline-terminated ASCII art
+        """
+        if dice.sides == 6:
+            art = DiceVisualizer.D6_ART_STR.get(result)
+            return art if art is not None else f"Rolled: {result}\n"
+        return DiceVisualizer._TEMPLATE_STR % (dice.sides, result) + "\n"
+
     @staticmethod
     def display_generic(dice: 'Dice', result: int) -> None:
         """
         Display generic dice representation.
-        
+
         Args:
             dice (Dice): The dice object
             result (int): Roll result
         """
-        if dice.sides == 6:
-            DiceVisualizer.display_d6(result)
-        else:
-            art = [line.format(sides=dice.sides, result=result) 
-                  for line in DiceVisualizer.OTHER_DICE_TEMPLATE]
-            print("\n".join(art))
+        sys.stdout.write(DiceVisualizer.render_generic(dice, result))
     
     @staticmethod
     def display_multiple(results: dict) -> None:
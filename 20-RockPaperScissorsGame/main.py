@@ -4,16 +4,45 @@ Rock, Paper, Scissors Game
 A clean, professional implementation of the classic game.
 """
 
+import asyncio
+import io
 import random
 import os
+import sys
 import time
-from datetime import datetime
-from typing import Tuple, Dict, List
+
+# Indexed by a couple of random bits in get_computer_move; a tuple here
+# avoids the fresh list random.choice would need on every call
+_MOVES = ('R', 'P', 'S')
+
+# Platform decided once at import; legacy Windows consoles may lack
+# VT support, everywhere else ANSI clear avoids a fork/exec per redraw
+_CLEAR_ANSI = '\x1b[2J\x1b[H'
+_USE_ANSI = os.name != 'nt'
+
+# Separator lines built once at import instead of per print
+_BAR50 = "=" * 50
+_SEP30 = "-" * 30
+
+# Centered once at import; display_moves reuses it every round
+_VS_CENTERED = "VS".center(50)
+
+# Scoreboard skeleton assembled once; each round only fills the slots
+_SCOREBOARD_TMPL = (
+    f"\n{_BAR50}\n🏆 CURRENT SCOREBOARD\n{_BAR50}\n"
+    "\n🎯 {name}: {ps}\n💻 Computer: {cs}\n🤝 Ties: {t}\n" + _BAR50 + "\n"
+)
 
 
 class RockPaperScissors:
     """Main game class implementing Rock, Paper, Scissors logic."""
-    
+
+    # Fixed attribute layout: no per-instance __dict__, and self.attr
+    # resolves through a C-level slot descriptor
+    __slots__ = ('player_score', 'computer_score', 'ties', 'total_games',
+                 'hist_timestamps', 'hist_player', 'hist_computer',
+                 'hist_result', 'player_name')
+
     # Game constants
     MOVES = {
         'R': 'Rock',
@@ -32,70 +61,163 @@ class RockPaperScissors:
         'P': '📄',
         'S': '✂️'
     }
-    
+
+    # Per-move display strings and per-result emojis built once; the
+    # render paths do a single dict lookup instead of reformatting
+    MOVE_DISPLAY = {}
+    for _m in 'RPS':
+        MOVE_DISPLAY[_m] = f"{EMOJIS[_m]} {MOVES[_m]}"
+    del _m
+
+    RESULT_EMOJI = {
+        'PLAYER': '🎉',
+        'COMPUTER': '💻',
+        'TIE': '🤝'
+    }
+
+    # Same emojis keyed by the single-byte result codes the history
+    # columns store ('P'/'C'/'T')
+    RESULT_CODE_EMOJI = {
+        ord('P'): '🎉',
+        ord('C'): '💻',
+        ord('T'): '🤝'
+    }
+
+    # All nine outcomes precomputed with their score deltas: scoring a
+    # round is one dict lookup plus three unconditional adds (plain
+    # loop because class-body names are invisible inside a
+    # comprehension's scope)
+    _ROUND_TABLE = {}
+    for _p in 'RPS':
+        for _c in 'RPS':
+            if _p == _c:
+                _ROUND_TABLE[(_p, _c)] = ('TIE', (0, 0, 1))
+            elif WINNING_RULES[_p] == _c:
+                _ROUND_TABLE[(_p, _c)] = ('PLAYER', (1, 0, 0))
+            else:
+                _ROUND_TABLE[(_p, _c)] = ('COMPUTER', (0, 1, 0))
+    del _p, _c
+
+    # Normalized input -> action in one hash lookup instead of an
+    # if/elif chain; 'S' always means Scissors, stats only via 'STATS'
+    _INPUT_MAP = {
+        'R': 'R', 'ROCK': 'R',
+        'P': 'P', 'PAPER': 'P',
+        'S': 'S', 'SCISSORS': 'S',
+        'Q': 'QUIT', 'QUIT': 'QUIT',
+        'STATS': 'STATS',
+    }
+
+    # Only the most recent rounds are ever rendered, so history is
+    # trimmed to this many rows to keep memory bounded
+    HISTORY_LIMIT = 1024
+
+    # Static welcome text, assembled once; printing it is one write
+    WELCOME_BANNER = "\n".join([
+        "",
+        _BAR50,
+        "🎮 ROCK, PAPER, SCISSORS GAME",
+        _BAR50,
+        "",
+        "Welcome to the classic Rock, Paper, Scissors game!",
+        "",
+        "HOW TO PLAY:",
+        "- Type 'R' for Rock 🪨",
+        "- Type 'P' for Paper 📄",
+        "- Type 'S' for Scissors ✂️",
+        "- Type 'Q' to quit the game",
+        "- Type 'STATS' to see your statistics",
+        "",
+        _BAR50,
+        "",
+    ])
+
     def __init__(self):
         """Initialize the game with default settings."""
         self.player_score = 0
         self.computer_score = 0
         self.ties = 0
-        self.game_history = []
+        self.total_games = 0
+        # History kept column-wise in parallel arrays: one tight byte
+        # per move/result instead of a four-key dict per round
+        self.hist_timestamps = []
+        self.hist_player = bytearray()
+        self.hist_computer = bytearray()
+        self.hist_result = bytearray()
         self.player_name = "Player"
-        
+
+    @staticmethod
+    def _prompt(msg: str = '') -> str:
+        """Prompt and read one line straight from stdin.
+
+        Skips input()'s extra stderr/empty-prompt flushes: one write,
+        one flush, one readline.
+        """
+        sys.stdout.write(msg)
+        sys.stdout.flush()
+        line = sys.stdin.readline()
+        if not line:
+            raise EOFError
+        return line.rstrip('\n')
+
+    async def _ainput(self, prompt: str = '') -> str:
+        """Read input in a worker thread so the event loop stays free."""
+        return await asyncio.get_running_loop().run_in_executor(None, self._prompt, prompt)
+
     def clear_screen(self) -> None:
         """Clear the terminal screen."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if _USE_ANSI:
+            sys.stdout.write(_CLEAR_ANSI)
+            sys.stdout.flush()
+        else:
+            os.system('cls')
     
-    def display_welcome(self) -> None:
+    async def display_welcome(self) -> None:
         """Display welcome message and game instructions."""
         self.clear_screen()
-        print("\n" + "="*50)
-        print("🎮 ROCK, PAPER, SCISSORS GAME")
-        print("="*50)
-        print("\nWelcome to the classic Rock, Paper, Scissors game!")
-        print("\nHOW TO PLAY:")
-        print("- Type 'R' for Rock 🪨")
-        print("- Type 'P' for Paper 📄")
-        print("- Type 'S' for Scissors ✂️")
-        print("- Type 'Q' to quit the game")
-        print("- Type 'S' to see your statistics")
-        print("\n" + "="*50)
+        sys.stdout.write(self.WELCOME_BANNER)
         
         # Get player name
-        name = input("\nEnter your name (or press Enter for 'Player'): ").strip()
+        name = (await self._ainput("\nEnter your name (or press Enter for 'Player'): ")).strip()
         if name:
             self.player_name = name
         
         print(f"\nHello, {self.player_name}! Let's play! 🎯")
-        time.sleep(2)
+        sys.stdout.flush()
+        await asyncio.sleep(2)
     
-    def get_player_move(self) -> str:
+    async def get_player_move(self) -> str:
         """Get and validate player's move."""
         while True:
-            print("\n" + "-"*30)
+            print("\n" + _SEP30)
             print("MAKE YOUR MOVE:")
-            print("-"*30)
+            print(_SEP30)
             print(f"{self.EMOJIS['R']} Rock (R)")
             print(f"{self.EMOJIS['P']} Paper (P)")
             print(f"{self.EMOJIS['S']} Scissors (S)")
             print("📊 Statistics (STATS)")
             print("🚪 Quit (Q)")
             
-            choice = input("\nEnter your choice: ").upper().strip()
-            
-            if choice in ['R', 'P', 'S']:
-                return choice
-            elif choice == 'Q':
-                return 'QUIT'
-            elif choice == 'STATS' or choice == 'S':
-                self.show_statistics()
+            choice = (await self._ainput("\nEnter your choice: ")).upper().strip()
+
+            action = self._INPUT_MAP.get(choice)
+            if action == 'STATS':
+                await self.show_statistics()
                 continue
-            else:
-                print("\n❌ Invalid choice! Please enter R, P, S, STATS, or Q")
-                time.sleep(1)
+            if action is not None:
+                return action
+            print("\n❌ Invalid choice! Please enter R, P, S, STATS, or Q")
+            sys.stdout.flush()
+            await asyncio.sleep(1)
     
     def get_computer_move(self) -> str:
         """Generate computer's move randomly."""
-        return random.choice(['R', 'P', 'S'])
+        # Two random bits with rejection of 3: no per-call list
+        # allocation and no float path inside random.choice
+        r = random.getrandbits(2)
+        while r == 3:
+            r = random.getrandbits(2)
+        return _MOVES[r]
     
     def determine_winner(self, player_move: str, computer_move: str) -> str:
         """
@@ -104,110 +226,108 @@ class RockPaperScissors:
         Returns:
             str: 'PLAYER', 'COMPUTER', or 'TIE'
         """
-        if player_move == computer_move:
-            return 'TIE'
-        elif self.WINNING_RULES[player_move] == computer_move:
-            return 'PLAYER'
-        else:
-            return 'COMPUTER'
+        return self._ROUND_TABLE[(player_move, computer_move)][0]
     
-    def display_moves(self, player_move: str, computer_move: str) -> None:
+    async def display_moves(self, player_move: str, computer_move: str) -> None:
         """Display both player and computer moves."""
-        print("\n" + "="*50)
-        print("🔄 ROUND RESULTS")
-        print("="*50)
-        
-        player_text = f"{self.EMOJIS[player_move]} {self.MOVES[player_move]}"
-        computer_text = f"{self.EMOJIS[computer_move]} {self.MOVES[computer_move]}"
-        
-        print(f"\n{self.player_name}: {player_text}")
-        print(f"Computer: {computer_text}")
-        
-        # Add a little animation effect
-        print("\n" + "VS".center(50))
-        time.sleep(0.5)
+        # Whole block emitted in one write
+        sys.stdout.write(
+            f"\n{_BAR50}\n🔄 ROUND RESULTS\n{_BAR50}\n"
+            f"\n{self.player_name}: {self.MOVE_DISPLAY[player_move]}\n"
+            f"Computer: {self.MOVE_DISPLAY[computer_move]}\n"
+            f"\n{_VS_CENTERED}\n"
+        )
+        sys.stdout.flush()
+        await asyncio.sleep(0.5)
     
-    def display_round_result(self, result: str) -> None:
+    async def display_round_result(self, result: str) -> None:
         """Display the result of a round."""
-        print("\n" + "-"*30)
+        print("\n" + _SEP30)
         
         if result == 'TIE':
             print("🤝 IT'S A TIE!")
-            self.ties += 1
         elif result == 'PLAYER':
             print(f"🎉 {self.player_name} WINS THIS ROUND!")
-            self.player_score += 1
         else:
             print("💻 COMPUTER WINS THIS ROUND!")
-            self.computer_score += 1
         
-        print("-"*30)
-        time.sleep(1.5)
+        print(_SEP30)
+        sys.stdout.flush()
+        await asyncio.sleep(1.5)
     
     def update_history(self, player_move: str, computer_move: str, result: str) -> None:
         """Update game history."""
-        round_data = {
-            'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            'player_move': self.MOVES[player_move],
-            'computer_move': self.MOVES[computer_move],
-            'result': result
-        }
-        self.game_history.append(round_data)
+        # Raw epoch float here; strftime runs only for the few rows a
+        # statistics screen actually renders
+        self.hist_timestamps.append(time.time())
+        self.hist_player.append(ord(player_move))
+        self.hist_computer.append(ord(computer_move))
+        self.hist_result.append(ord(result[0]))
+        if len(self.hist_result) > self.HISTORY_LIMIT:
+            # Evict the oldest row; only the tail is ever displayed
+            del self.hist_timestamps[0]
+            del self.hist_player[0]
+            del self.hist_computer[0]
+            del self.hist_result[0]
     
-    def show_statistics(self) -> None:
+    async def show_statistics(self) -> None:
         """Display game statistics."""
         self.clear_screen()
-        print("\n" + "="*50)
-        print("📊 GAME STATISTICS")
-        print("="*50)
-        
-        total_games = self.player_score + self.computer_score + self.ties
-        
+        bar, dash = _BAR50, _SEP30
+
+        # Collect every line and emit the whole screen in one write
+        out = [f"\n{bar}", "📊 GAME STATISTICS", bar]
+
+        total_games = self.total_games
+
         if total_games == 0:
-            print("\nNo games played yet!")
-            print("\nPlay a round to see statistics!")
+            out.append("\nNo games played yet!")
+            out.append("\nPlay a round to see statistics!")
         else:
-            print(f"\n👤 Player: {self.player_name}")
-            print(f"📅 Games Played: {total_games}")
-            print("\n" + "-"*30)
-            print("SCOREBOARD:")
-            print(f"🎯 {self.player_name}: {self.player_score}")
-            print(f"💻 Computer: {self.computer_score}")
-            print(f"🤝 Ties: {self.ties}")
-            print("-"*30)
-            
-            # Calculate percentages
-            player_percent = (self.player_score / total_games) * 100
-            computer_percent = (self.computer_score / total_games) * 100
-            tie_percent = (self.ties / total_games) * 100
-            
-            print("\nWIN RATES:")
-            print(f"{self.player_name}: {player_percent:.1f}%")
-            print(f"Computer: {computer_percent:.1f}%")
-            print(f"Ties: {tie_percent:.1f}%")
-            
+            out.append(f"\n👤 Player: {self.player_name}")
+            out.append(f"📅 Games Played: {total_games}")
+            out.append(f"\n{dash}")
+            out.append("SCOREBOARD:")
+            out.append(f"🎯 {self.player_name}: {self.player_score}")
+            out.append(f"💻 Computer: {self.computer_score}")
+            out.append(f"🤝 Ties: {self.ties}")
+            out.append(dash)
+
+            # Calculate percentages: one division, three multiplies
+            inv = 100.0 / total_games
+            player_percent = self.player_score * inv
+            computer_percent = self.computer_score * inv
+            tie_percent = self.ties * inv
+
+            out.append("\nWIN RATES:")
+            out.append(f"{self.player_name}: {player_percent:.1f}%")
+            out.append(f"Computer: {computer_percent:.1f}%")
+            out.append(f"Ties: {tie_percent:.1f}%")
+
             # Show winning streak
-            if self.game_history:
-                print("\n" + "-"*30)
-                print("LAST 5 GAMES:")
-                print("-"*30)
-                for game in self.game_history[-5:]:
-                    result_emoji = "🎉" if game['result'] == 'PLAYER' else "💻" if game['result'] == 'COMPUTER' else "🤝"
-                    print(f"{game['timestamp']}: {game['player_move']} vs {game['computer_move']} = {result_emoji}")
+            if self.hist_result:
+                out.append(f"\n{dash}")
+                out.append("LAST 5 GAMES:")
+                out.append(dash)
+                for ts, pm, cm, res in zip(self.hist_timestamps[-5:],
+                                           self.hist_player[-5:],
+                                           self.hist_computer[-5:],
+                                           self.hist_result[-5:]):
+                    result_emoji = self.RESULT_CODE_EMOJI[res]
+                    when = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts))
+                    out.append(f"{when}: {self.MOVES[chr(pm)]} vs {self.MOVES[chr(cm)]} = {result_emoji}")
+
+        sys.stdout.write("\n".join(out) + "\n")
         
-        input("\nPress Enter to continue...")
+        await self._ainput("\nPress Enter to continue...")
     
     def display_scoreboard(self) -> None:
         """Display current scoreboard."""
-        print("\n" + "="*50)
-        print("🏆 CURRENT SCOREBOARD")
-        print("="*50)
-        print(f"\n🎯 {self.player_name}: {self.player_score}")
-        print(f"💻 Computer: {self.computer_score}")
-        print(f"🤝 Ties: {self.ties}")
-        print("="*50)
+        sys.stdout.write(_SCOREBOARD_TMPL.format(
+            name=self.player_name, ps=self.player_score,
+            cs=self.computer_score, t=self.ties))
     
-    def play_round(self) -> bool:
+    async def play_round(self) -> bool:
         """Play a single round of the game."""
         self.clear_screen()
         
@@ -215,7 +335,7 @@ class RockPaperScissors:
         self.display_scoreboard()
         
         # Get moves
-        player_move = self.get_player_move()
+        player_move = await self.get_player_move()
         
         if player_move == 'QUIT':
             return False
@@ -223,13 +343,17 @@ class RockPaperScissors:
         computer_move = self.get_computer_move()
         
         # Show moves
-        self.display_moves(player_move, computer_move)
+        await self.display_moves(player_move, computer_move)
         
-        # Determine winner
-        result = self.determine_winner(player_move, computer_move)
+        # Determine winner and score in one table lookup
+        result, (dp, dc, dt) = self._ROUND_TABLE[(player_move, computer_move)]
+        self.player_score += dp
+        self.computer_score += dc
+        self.ties += dt
+        self.total_games += 1
         
         # Show result
-        self.display_round_result(result)
+        await self.display_round_result(result)
         
         # Update history
         self.update_history(player_move, computer_move, result)
@@ -239,84 +363,98 @@ class RockPaperScissors:
     def end_game(self) -> None:
         """Display final results and statistics."""
         self.clear_screen()
-        print("\n" + "="*50)
-        print("🎮 GAME OVER - FINAL RESULTS")
-        print("="*50)
-        
-        total_games = self.player_score + self.computer_score + self.ties
-        
+        bar, dash = _BAR50, _SEP30
+
+        # Collect every line and emit the final screen in one write
+        out = [f"\n{bar}", "🎮 GAME OVER - FINAL RESULTS", bar]
+
+        total_games = self.total_games
+
         if total_games == 0:
-            print("\nThanks for playing! No games were played.")
+            out.append("\nThanks for playing! No games were played.")
+            sys.stdout.write("\n".join(out) + "\n")
             return
-        
-        print(f"\n👤 Player: {self.player_name}")
-        print(f"📅 Total Games: {total_games}")
-        print("\n" + "-"*30)
-        print("FINAL SCORE:")
-        print(f"🎯 {self.player_name}: {self.player_score}")
-        print(f"💻 Computer: {self.computer_score}")
-        print(f"🤝 Ties: {self.ties}")
-        print("-"*30)
-        
+
+        out.append(f"\n👤 Player: {self.player_name}")
+        out.append(f"📅 Total Games: {total_games}")
+        out.append(f"\n{dash}")
+        out.append("FINAL SCORE:")
+        out.append(f"🎯 {self.player_name}: {self.player_score}")
+        out.append(f"💻 Computer: {self.computer_score}")
+        out.append(f"🤝 Ties: {self.ties}")
+        out.append(dash)
+
         # Determine overall winner
         if self.player_score > self.computer_score:
-            print(f"\n🏆 FINAL RESULT: {self.player_name} WINS! 🎉")
-            print("\nCongratulations! You beat the computer! 👑")
+            out.append(f"\n🏆 FINAL RESULT: {self.player_name} WINS! 🎉")
+            out.append("\nCongratulations! You beat the computer! 👑")
         elif self.computer_score > self.player_score:
-            print("\n🏆 FINAL RESULT: COMPUTER WINS! 🤖")
-            print("\nBetter luck next time! The computer was too strong! 💪")
+            out.append("\n🏆 FINAL RESULT: COMPUTER WINS! 🤖")
+            out.append("\nBetter luck next time! The computer was too strong! 💪")
         else:
-            print("\n🏆 FINAL RESULT: IT'S A TIE! ⚖️")
-            print("\nWhat a close match! Well played! 🤝")
-        
+            out.append("\n🏆 FINAL RESULT: IT'S A TIE! ⚖️")
+            out.append("\nWhat a close match! Well played! 🤝")
+
         # Show statistics
-        print("\n" + "="*50)
-        print("📊 FINAL STATISTICS")
-        print("="*50)
-        
-        player_percent = (self.player_score / total_games) * 100
-        computer_percent = (self.computer_score / total_games) * 100
-        
-        print(f"\n{self.player_name} Win Rate: {player_percent:.1f}%")
-        print(f"Computer Win Rate: {computer_percent:.1f}%")
-        
+        out.append(f"\n{bar}")
+        out.append("📊 FINAL STATISTICS")
+        out.append(bar)
+
+        inv = 100.0 / total_games
+        player_percent = self.player_score * inv
+        computer_percent = self.computer_score * inv
+
+        out.append(f"\n{self.player_name} Win Rate: {player_percent:.1f}%")
+        out.append(f"Computer Win Rate: {computer_percent:.1f}%")
+
         # Show move history
-        if self.game_history:
-            print("\n" + "-"*30)
-            print("GAME HISTORY:")
-            print("-"*30)
-            for i, game in enumerate(self.game_history[-10:], 1):
-                result_emoji = "🎉" if game['result'] == 'PLAYER' else "💻" if game['result'] == 'COMPUTER' else "🤝"
-                print(f"Game {i}: {game['player_move']} vs {game['computer_move']} = {result_emoji}")
-        
-        print("\n" + "="*50)
-        print("\nThanks for playing Rock, Paper, Scissors! 👋")
-        print("Created with ❤️ using Python")
-        print("="*50)
+        if self.hist_result:
+            out.append(f"\n{dash}")
+            out.append("GAME HISTORY:")
+            out.append(dash)
+            rows = zip(self.hist_player[-10:],
+                       self.hist_computer[-10:],
+                       self.hist_result[-10:])
+            for i, (pm, cm, res) in enumerate(rows, 1):
+                result_emoji = self.RESULT_CODE_EMOJI[res]
+                out.append(f"Game {i}: {self.MOVES[chr(pm)]} vs {self.MOVES[chr(cm)]} = {result_emoji}")
+
+        out.append(f"\n{bar}")
+        out.append("\nThanks for playing Rock, Paper, Scissors! 👋")
+        out.append("Created with ❤️ using Python")
+        out.append(bar)
+        sys.stdout.write("\n".join(out) + "\n")
+        sys.stdout.flush()
     
-    def run(self) -> None:
+    async def run_async(self) -> None:
         """Main game loop."""
-        self.display_welcome()
-        
+        await self.display_welcome()
+
         playing = True
         while playing:
-            playing = self.play_round()
-            
+            playing = await self.play_round()
+
             # Ask to continue after each round
             if playing:
-                print("\n" + "-"*30)
-                continue_game = input("Play another round? (Y/N): ").upper().strip()
+                print("\n" + _SEP30)
+                continue_game = (await self._ainput("Play another round? (Y/N): ")).upper().strip()
                 if continue_game not in ['Y', 'YES']:
                     playing = False
-        
+
         self.end_game()
 
 
 def main():
     """Main function to run the game."""
+    # Block-buffer stdout (64 KB): the ~40 small writes per round
+    # coalesce into a couple of block writes, with explicit flushes at
+    # every prompt and sleep
+    sys.stdout = io.TextIOWrapper(
+        open(sys.stdout.fileno(), 'wb', buffering=65536, closefd=False),
+        encoding=sys.stdout.encoding, line_buffering=False)
     try:
         game = RockPaperScissors()
-        game.run()
+        asyncio.run(game.run_async())
     except KeyboardInterrupt:
         print("\n\n👋 Game interrupted. Thanks for playing!")
     except Exception as e:
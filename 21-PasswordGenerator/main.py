@@ -4,17 +4,159 @@ Password Generator
 A professional, secure password generator with multiple options.
 """
 
+import functools
+import math
+import operator
 import random
 import string
 import secrets
 import os
+import re
 import sys
 import time
 import json
 import hashlib
+from collections import deque
 from datetime import datetime
+from itertools import islice
 from typing import List, Dict, Optional, Tuple
 
+import numpy as np
+
+# Platform decided once at import; legacy Windows consoles may lack
+# VT support, everywhere else ANSI clear avoids a fork/exec per redraw
+_CLEAR_ANSI = '\x1b[2J\x1b[H'
+_USE_ANSI = os.name != 'nt'
+
+
+def _bulk_choice(alphabet: bytes, n: int) -> str:
+    """
+    Draw n uniform characters from alphabet with one bulk CSPRNG read.
+
+    Pulls a batch from secrets.token_bytes, masks each byte down to the
+    smallest power of two covering the alphabet and rejects the
+    out-of-range remainder, so the result stays unbiased while the
+    per-character Python overhead of secrets.choice disappears.
+
+    Args:
+        alphabet: Candidate characters as ASCII bytes
+        n: Number of characters to draw
+
+    Returns:
+        Generated string of length n
+    """
+    size = len(alphabet)
+    mask = (1 << (size - 1).bit_length()) - 1
+    lut = np.frombuffer(alphabet, dtype=np.uint8)
+
+    picks = np.empty(n, dtype=np.uint8)
+    filled = 0
+    while filled < n:
+        # Oversample to cover expected rejections in a single pass
+        buf = np.frombuffer(
+            secrets.token_bytes(int((n - filled) * 1.5) + 8), dtype=np.uint8
+        ) & mask
+        buf = buf[buf < size]
+        take = min(len(buf), n - filled)
+        picks[filled:filled + take] = lut[buf[:take]]
+        filled += take
+
+    return picks.tobytes().decode('ascii')
+
+
+def _make_class_table() -> bytes:
+    """256-entry byte -> character-class bitmask table.
+
+    Bits: 1=lowercase, 2=uppercase, 4=digit, 8=non-alphanumeric.
+    Lets check_strength classify a whole password in one C-level
+    translate pass instead of four any() scans.
+    """
+    table = bytearray(256)
+    for b in range(256):
+        c = chr(b)
+        bits = 0
+        if c.islower():
+            bits |= 1
+        if c.isupper():
+            bits |= 2
+        if c.isdigit():
+            bits |= 4
+        if not c.isalnum():
+            bits |= 8
+        table[b] = bits
+    return bytes(table)
+
+
+_CLASS_TABLE = _make_class_table()
+
+# charset_size is bounded well below 128, so entropy-per-character is
+# a tuple lookup instead of a log call per check
+_LOG2_TABLE = tuple(math.log2(n) if n else 0.0 for n in range(128))
+
+# One CSPRNG-backed generator shared by every memorable-password call
+_SYSRAND = secrets.SystemRandom()
+
+# Common words for memorable passwords, allocated once at import
+WORDS = (
+    'apple', 'banana', 'cherry', 'dog', 'elephant', 'flower', 'garden',
+    'house', 'island', 'jungle', 'king', 'lion', 'mountain', 'night',
+    'ocean', 'piano', 'queen', 'river', 'sun', 'tree', 'umbrella',
+    'violet', 'water', 'xylophone', 'yellow', 'zebra', 'air', 'bird',
+    'cat', 'desk', 'earth', 'fire', 'grass', 'heart', 'ice', 'jacket',
+    'kite', 'light', 'moon', 'note', 'orange', 'paper', 'quiet',
+    'rain', 'star', 'time', 'unit', 'voice', 'wind', 'year', 'zone',
+    'book', 'chair', 'door', 'edge', 'fish', 'glass', 'hat', 'ink',
+    'jump', 'key', 'lamp', 'map', 'nest', 'open', 'park', 'quiz',
+    'road', 'ship', 'train', 'user', 'view', 'wall', 'xray', 'yarn'
+)
+
+# Deletion tables built once; stripping excluded characters is a
+# single translate pass instead of one replace scan per character
+_TT_SIMILAR = str.maketrans('', '', 'il1Lo0O')
+_TT_AMBIG = str.maketrans('', '', '"\'`~')
+
+# Compiled once; both pattern scans run in C instead of a Python loop
+# with per-character int() conversions
+_RE_SEQ3 = re.compile('012|123|234|345|456|567|678|789')
+_RE_REPEAT3 = re.compile(r'(.)\1\1')
+
+
+@functools.lru_cache(maxsize=64)
+def _build_charset(include_lower: bool, include_upper: bool,
+                   include_digits: bool, include_symbols: bool,
+                   exclude_similar: bool, exclude_ambiguous: bool) -> str:
+    """
+    Build (and memoize) the character set for one combination of flags.
+
+    Only 64 flag combinations exist, so repeated custom generation with
+    the same options skips the concatenation and replace passes
+    entirely.
+    """
+    sets = PasswordGenerator.CHARACTER_SETS
+    chars = ''
+
+    if include_lower:
+        chars += sets['lowercase']
+    if include_upper:
+        chars += sets['uppercase']
+    if include_digits:
+        chars += sets['digits']
+    if include_symbols:
+        chars += sets['symbols']
+
+    # Remove similar characters if requested
+    if exclude_similar:
+        chars = chars.translate(_TT_SIMILAR)
+
+    # Remove ambiguous characters if requested
+    if exclude_ambiguous:
+        chars = chars.translate(_TT_AMBIG)
+
+    if not chars:
+        raise ValueError("At least one character set must be selected")
+
+    return chars
+
 
 class PasswordGenerator:
     """Main password generator class with multiple generation strategies."""
@@ -36,26 +178,49 @@ class PasswordGenerator:
         'very_strong': {'length': 20, 'sets': ['lowercase', 'uppercase', 'digits', 'symbols']},
     }
     
-    # Common passwords to avoid (top 20 most common)
-    COMMON_PASSWORDS = [
+    # Emoji per strength label (both display and stats casings) built
+    # once; view loops do a single dict lookup per entry
+    _STRENGTH_EMOJI = {
+        'Very Strong': '🟢',
+        'Strong': '🟢',
+        'Medium': '🟡',
+        'Weak': '🟠',
+        'Very Weak': '🔴',
+        'strong': '🟢',
+        'medium': '🟡',
+        'weak': '🔴',
+    }
+    
+    # Valid menu keys precomputed; the prompt loop does one O(1)
+    # membership test instead of rebuilding a ten-string list
+    _VALID_CHOICES = frozenset('0123456789')
+    
+    # Common passwords to avoid (top 20 most common); frozenset gives
+    # O(1) membership instead of a linear scan per strength check
+    COMMON_PASSWORDS = frozenset({
         'password', '123456', '12345678', '1234', 'qwerty',
         '12345', 'dragon', 'baseball', 'football', 'letmein',
         'monkey', 'abc123', '111111', 'mustang', 'access',
         'shadow', 'master', 'michael', 'superman', '696969'
-    ]
+    })
     
     def __init__(self):
         """Initialize the password generator."""
-        self.generated_passwords = []
+        # Single bounded store: the old duplicate stats['history'] list
+        # doubled memory, and the cap keeps long sessions bounded
+        self.generated_passwords = deque(maxlen=10_000)
         self.stats = {
             'total_generated': 0,
             'strength_counts': {'weak': 0, 'medium': 0, 'strong': 0, 'very_strong': 0},
-            'history': []
         }
         
     def clear_screen(self) -> None:
         """Clear the terminal screen."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if _USE_ANSI:
+            sys.stdout.write(_CLEAR_ANSI)
+            sys.stdout.flush()
+        else:
+            os.system('cls')
     
     def display_banner(self) -> None:
         """Display the application banner."""
@@ -89,7 +254,7 @@ class PasswordGenerator:
         while True:
             try:
                 choice = input("\nEnter your choice (0-9): ").strip()
-                if choice in [str(i) for i in range(10)]:
+                if choice in self._VALID_CHOICES:
                     return choice
                 else:
                     print("❌ Please enter a number between 0 and 9")
@@ -117,32 +282,9 @@ class PasswordGenerator:
         Returns:
             String of characters to use for generation
         """
-        chars = ''
-        
-        if include_lower:
-            chars += self.CHARACTER_SETS['lowercase']
-        if include_upper:
-            chars += self.CHARACTER_SETS['uppercase']
-        if include_digits:
-            chars += self.CHARACTER_SETS['digits']
-        if include_symbols:
-            chars += self.CHARACTER_SETS['symbols']
-        
-        # Remove similar characters if requested
-        if exclude_similar:
-            for similar_char in self.CHARACTER_SETS['similar']:
-                chars = chars.replace(similar_char, '')
-        
-        # Remove ambiguous characters if requested
-        if exclude_ambiguous:
-            ambiguous = '"\'`~'
-            for amb_char in ambiguous:
-                chars = chars.replace(amb_char, '')
-        
-        if not chars:
-            raise ValueError("At least one character set must be selected")
-        
-        return chars
+        return _build_charset(include_lower, include_upper, include_digits,
+                              include_symbols, exclude_similar,
+                              exclude_ambiguous)
     
     def generate_by_strength(self, strength_level: str = 'strong') -> str:
         """
@@ -167,8 +309,8 @@ class PasswordGenerator:
             chars += self.CHARACTER_SETS.get(char_set, '')
         
         # Generate password
-        password = ''.join(secrets.choice(chars) for _ in range(length))
-        
+        password = _bulk_choice(chars.encode('ascii'), length)
+
         # Update statistics
         self.stats['strength_counts'][strength_level] += 1
         self._add_to_history(password, strength_level)
@@ -199,11 +341,11 @@ class PasswordGenerator:
             raise ValueError("Character set too small. Include more character types.")
         
         # Generate password
-        password = ''.join(secrets.choice(chars) for _ in range(length))
-        
+        password = _bulk_choice(chars.encode('ascii'), length)
+
         # Determine strength
         strength = self._estimate_strength(password)
-        self._add_to_history(password, 'custom')
+        self._add_to_history(password, 'custom', strength)
         self.stats['strength_counts'][strength] += 1
         
         return password
@@ -224,10 +366,42 @@ class PasswordGenerator:
         if count > 50:
             raise ValueError("Cannot generate more than 50 passwords at once")
         
-        passwords = []
-        for i in range(count):
-            password = self.generate_by_strength(strength)
-            passwords.append(password)
+        return self._generate_by_strength_bulk(strength, count)
+    
+    def _generate_by_strength_bulk(self, strength_level: str, count: int) -> List[str]:
+        """Generate count passwords of one strength in a single draw.
+        
+        Resolves the level config and character set once, pulls all
+        count * length characters from one bulk CSPRNG read, then
+        slices and books the statistics as a batch.
+        """
+        if strength_level not in self.STRENGTH_LEVELS:
+            raise ValueError(f"Invalid strength level. Choose from: {list(self.STRENGTH_LEVELS.keys())}")
+        
+        config = self.STRENGTH_LEVELS[strength_level]
+        length = config['length']
+        
+        chars = ''
+        for char_set in config['sets']:
+            chars += self.CHARACTER_SETS.get(char_set, '')
+        
+        blob = _bulk_choice(chars.encode('ascii'), count * length)
+        passwords = [blob[i:i + length] for i in range(0, count * length, length)]
+        
+        # One timestamp and one counter update for the whole batch
+        now = datetime.now()
+        entries = [
+            {
+                'password': password,
+                'type': strength_level,
+                'timestamp': now,
+                'strength': self._estimate_strength(password)
+            }
+            for password in passwords
+        ]
+        self.generated_passwords.extend(entries)
+        self.stats['total_generated'] += count
+        self.stats['strength_counts'][strength_level] += count
         
         return passwords
     
@@ -245,22 +419,8 @@ class PasswordGenerator:
         Returns:
             Memorable password
         """
-        # Common words list (100 common words)
-        words = [
-            'apple', 'banana', 'cherry', 'dog', 'elephant', 'flower', 'garden',
-            'house', 'island', 'jungle', 'king', 'lion', 'mountain', 'night',
-            'ocean', 'piano', 'queen', 'river', 'sun', 'tree', 'umbrella',
-            'violet', 'water', 'xylophone', 'yellow', 'zebra', 'air', 'bird',
-            'cat', 'desk', 'earth', 'fire', 'grass', 'heart', 'ice', 'jacket',
-            'kite', 'light', 'moon', 'note', 'orange', 'paper', 'quiet',
-            'rain', 'star', 'time', 'unit', 'voice', 'wind', 'year', 'zone',
-            'book', 'chair', 'door', 'edge', 'fish', 'glass', 'hat', 'ink',
-            'jump', 'key', 'lamp', 'map', 'nest', 'open', 'park', 'quiz',
-            'road', 'ship', 'train', 'user', 'view', 'wall', 'xray', 'yarn'
-        ]
-        
-        # Select random words
-        selected_words = secrets.SystemRandom().sample(words, word_count)
+        # Select random words (without replacement) from the shared table
+        selected_words = _SYSRAND.sample(WORDS, word_count)
         
         # Apply options
         if capitalize:
@@ -268,7 +428,11 @@ class PasswordGenerator:
         
         # Add number if requested
         if include_number:
-            number = str(secrets.randbelow(100))
+            # One bulk byte read with rejection of values >= 200 stays
+            # uniform over 0-99 without randbelow's Python bit loop;
+            # eight bytes make an all-rejected batch vanishingly rare
+            byte = next((b for b in secrets.token_bytes(8) if b < 200), None)
+            number = str(byte % 100 if byte is not None else secrets.randbelow(100))
             selected_words.append(number)
         
         # Join with separator
@@ -290,112 +454,26 @@ class PasswordGenerator:
         """
         if not password:
             return {'score': 0, 'strength': 'Very Weak', 'issues': ['Password is empty']}
-        
-        score = 0
-        issues = []
-        suggestions = []
-        
-        # Check length
-        if len(password) >= 12:
-            score += 3
-        elif len(password) >= 8:
-            score += 2
-        elif len(password) >= 6:
-            score += 1
-        else:
-            issues.append("Password is too short (minimum 6 characters)")
-        
-        # Check character variety
-        has_lower = any(c.islower() for c in password)
-        has_upper = any(c.isupper() for c in password)
-        has_digit = any(c.isdigit() for c in password)
-        has_symbol = any(not c.isalnum() for c in password)
-        
-        char_types = sum([has_lower, has_upper, has_digit, has_symbol])
-        
-        if char_types >= 4:
-            score += 3
-        elif char_types >= 3:
-            score += 2
-        elif char_types >= 2:
-            score += 1
-        else:
-            issues.append("Use more character types (lowercase, uppercase, digits, symbols)")
-        
-        # Check for common patterns
-        if password.lower() in self.COMMON_PASSWORDS:
-            score = 0
-            issues.append("Password is too common")
-        
-        # Check for sequences
-        if any(password[i:i+3].isdigit() and 
-               int(password[i]) + 1 == int(password[i+1]) and 
-               int(password[i+1]) + 1 == int(password[i+2]) 
-               for i in range(len(password)-2)):
-            issues.append("Contains sequential numbers")
-            score -= 1
-        
-        # Check for repeated characters
-        if any(password[i] == password[i+1] == password[i+2] 
-               for i in range(len(password)-2)):
-            issues.append("Contains repeated characters")
-            score -= 1
-        
-        # Calculate entropy (rough estimate)
-        charset_size = 0
-        if has_lower:
-            charset_size += 26
-        if has_upper:
-            charset_size += 26
-        if has_digit:
-            charset_size += 10
-        if has_symbol:
-            charset_size += len(self.CHARACTER_SETS['symbols'])
-        
-        if charset_size > 0:
-            entropy = len(password) * (charset_size ** 0.5)
-        else:
-            entropy = 0
-        
-        # Determine strength level
-        if score >= 5:
-            strength = "Very Strong" if entropy > 80 else "Strong"
-        elif score >= 3:
-            strength = "Medium"
-        elif score >= 1:
-            strength = "Weak"
-        else:
-            strength = "Very Weak"
-        
-        # Add suggestions
-        if not has_lower:
-            suggestions.append("Add lowercase letters")
-        if not has_upper:
-            suggestions.append("Add uppercase letters")
-        if not has_digit:
-            suggestions.append("Add digits")
-        if not has_symbol:
-            suggestions.append("Add symbols")
-        if len(password) < 12:
-            suggestions.append("Make password longer (at least 12 characters)")
-        
+
+        (score, strength, entropy, has_lower, has_upper, has_digit,
+         has_symbol, issues, suggestions) = _analyze(password)
+
         return {
-            'score': min(max(score, 0), 6),
+            'score': score,
             'strength': strength,
             'length': len(password),
-            'entropy': round(entropy, 2),
+            'entropy': entropy,
             'has_lower': has_lower,
             'has_upper': has_upper,
             'has_digit': has_digit,
             'has_symbol': has_symbol,
-            'issues': issues,
-            'suggestions': suggestions
+            'issues': list(issues),
+            'suggestions': list(suggestions)
         }
     
     def _estimate_strength(self, password: str) -> str:
         """Estimate password strength for statistics."""
-        analysis = self.check_strength(password)
-        score = analysis['score']
+        score = _analyze(password)[0] if password else 0
         
         if score >= 5:
             return 'strong'
@@ -404,16 +482,22 @@ class PasswordGenerator:
         else:
             return 'weak'
     
-    def _add_to_history(self, password: str, password_type: str) -> None:
-        """Add password to history."""
+    def _add_to_history(self, password: str, password_type: str,
+                        strength: Optional[str] = None) -> None:
+        """Add password to history.
+
+        Callers that already estimated the strength pass it in so the
+        analysis is not repeated here.
+        """
         entry = {
             'password': password,
             'type': password_type,
-            'timestamp': datetime.now().isoformat(),
-            'strength': self._estimate_strength(password)
+            # Stored as a datetime; views format on demand instead of
+            # re-parsing an ISO string per display
+            'timestamp': datetime.now(),
+            'strength': strength if strength is not None else self._estimate_strength(password)
         }
         self.generated_passwords.append(entry)
-        self.stats['history'].append(entry)
         self.stats['total_generated'] += 1
     
     def view_generated(self) -> None:
@@ -427,9 +511,11 @@ class PasswordGenerator:
             print("\nNo passwords generated yet!")
             return
         
-        for i, entry in enumerate(reversed(self.generated_passwords[-20:]), 1):
-            timestamp = datetime.fromisoformat(entry['timestamp']).strftime("%H:%M:%S")
-            strength_emoji = "🟢" if entry['strength'] == 'strong' else "🟡" if entry['strength'] == 'medium' else "🔴"
+        # reversed() on the list is O(1); islice caps the walk at 20
+        # rows without copying a slice first
+        for i, entry in enumerate(islice(reversed(self.generated_passwords), 20), 1):
+            timestamp = entry['timestamp'].strftime("%H:%M:%S")
+            strength_emoji = self._STRENGTH_EMOJI.get(entry['strength'], '⚪')
             print(f"\n{i:2d}. {strength_emoji} [{entry['type'].upper():10}] {timestamp}")
             print(f"    {entry['password']}")
         
@@ -459,8 +545,9 @@ class PasswordGenerator:
             print("\n" + "─" * 30)
             print("Recent Passwords:")
             print("─" * 30)
-            for entry in self.stats['history'][-5:]:
-                time_str = datetime.fromisoformat(entry['timestamp']).strftime("%H:%M")
+            recent = list(islice(reversed(self.generated_passwords), 5))
+            for entry in reversed(recent):
+                time_str = entry['timestamp'].strftime("%H:%M")
                 print(f"{time_str} - {entry['type']}: {entry['password'][:20]}...")
     
     def export_to_file(self, filename: str = "passwords.txt") -> None:
@@ -470,24 +557,29 @@ class PasswordGenerator:
             return
         
         try:
+            # Assemble the whole report in memory and write it once
+            bar = "=" * 60
+            parts = [
+                bar, "🔐 GENERATED PASSWORDS", bar, "",
+                f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+                f"Total: {len(self.generated_passwords)}", "",
+            ]
+            
+            for i, entry in enumerate(self.generated_passwords, 1):
+                timestamp = entry['timestamp'].strftime("%Y-%m-%d %H:%M:%S")
+                parts.append(f"{i:3d}. {entry['password']}")
+                parts.append(f"     Type: {entry['type']}, Strength: {entry['strength']}, Time: {timestamp}\n")
+            
+            parts += [
+                bar, "⚠️  SECURITY WARNING:",
+                "1. Store this file securely",
+                "2. Consider using a password manager",
+                "3. Never share passwords via email",
+                bar, "",
+            ]
+            
             with open(filename, 'w') as f:
-                f.write("=" * 60 + "\n")
-                f.write("🔐 GENERATED PASSWORDS\n")
-                f.write("=" * 60 + "\n\n")
-                f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"Total: {len(self.generated_passwords)}\n\n")
-                
-                for i, entry in enumerate(self.generated_passwords, 1):
-                    timestamp = datetime.fromisoformat(entry['timestamp']).strftime("%Y-%m-%d %H:%M:%S")
-                    f.write(f"{i:3d}. {entry['password']}\n")
-                    f.write(f"     Type: {entry['type']}, Strength: {entry['strength']}, Time: {timestamp}\n\n")
-                
-                f.write("=" * 60 + "\n")
-                f.write("⚠️  SECURITY WARNING:\n")
-                f.write("1. Store this file securely\n")
-                f.write("2. Consider using a password manager\n")
-                f.write("3. Never share passwords via email\n")
-                f.write("=" * 60 + "\n")
+                f.write("\n".join(parts))
             
             print(f"✅ Passwords exported to '{filename}'")
             print(f"📁 Total passwords saved: {len(self.generated_passwords)}")
@@ -503,7 +595,6 @@ class PasswordGenerator:
             self.stats = {
                 'total_generated': 0,
                 'strength_counts': {'weak': 0, 'medium': 0, 'strong': 0, 'very_strong': 0},
-                'history': []
             }
             print("✅ History cleared!")
         else:
@@ -514,15 +605,7 @@ class PasswordGenerator:
         if analysis is None:
             analysis = self.check_strength(password)
         
-        strength_colors = {
-            'Very Strong': '🟢',
-            'Strong': '🟢',
-            'Medium': '🟡',
-            'Weak': '🟠',
-            'Very Weak': '🔴'
-        }
-        
-        emoji = strength_colors.get(analysis['strength'], '⚪')
+        emoji = self._STRENGTH_EMOJI.get(analysis['strength'], '⚪')
         
         print("\n" + "═" * 50)
         print("🔐 GENERATED PASSWORD")
@@ -612,17 +695,28 @@ class PasswordGenerator:
                 except ValueError:
                     print("❌ Please enter a valid number")
             
-            # Get character set options
+            # Get character set options; a 6-char Y/N string answers
+            # everything in one round trip, Enter falls back to the
+            # one-question-at-a-time prompts
             print("\nSelect character sets to include:")
+            print("Tip: answer all six at once, e.g. YYYYNN for")
+            print("(lower, upper, digits, symbols, no-similar, no-ambiguous)")
             
-            options = {
-                'include_lower': input("Include lowercase letters? (Y/n): ").strip().lower() != 'n',
-                'include_upper': input("Include uppercase letters? (Y/n): ").strip().lower() != 'n',
-                'include_digits': input("Include digits? (Y/n): ").strip().lower() != 'n',
-                'include_symbols': input("Include symbols? (Y/n): ").strip().lower() != 'n',
-                'exclude_similar': input("Exclude similar characters (i, l, 1, L, o, 0, O)? (y/N): ").strip().lower() == 'y',
-                'exclude_ambiguous': input("Exclude ambiguous characters (\", ', `, ~)? (y/N): ").strip().lower() == 'y',
-            }
+            compact = input("\nOption string (or press Enter for prompts): ").strip().lower()
+            option_keys = ('include_lower', 'include_upper', 'include_digits',
+                           'include_symbols', 'exclude_similar', 'exclude_ambiguous')
+            
+            if len(compact) == 6 and set(compact) <= {'y', 'n'}:
+                options = dict(zip(option_keys, (c == 'y' for c in compact)))
+            else:
+                options = {
+                    'include_lower': input("Include lowercase letters? (Y/n): ").strip().lower() != 'n',
+                    'include_upper': input("Include uppercase letters? (Y/n): ").strip().lower() != 'n',
+                    'include_digits': input("Include digits? (Y/n): ").strip().lower() != 'n',
+                    'include_symbols': input("Include symbols? (Y/n): ").strip().lower() != 'n',
+                    'exclude_similar': input("Exclude similar characters (i, l, 1, L, o, 0, O)? (y/N): ").strip().lower() == 'y',
+                    'exclude_ambiguous': input("Exclude ambiguous characters (\", ', `, ~)? (y/N): ").strip().lower() == 'y',
+                }
             
             # Generate password
             password = self.generate_custom(length, **options)
@@ -783,7 +877,7 @@ class PasswordGenerator:
                     
                     for i, password in enumerate(passwords, 1):
                         strength = self._estimate_strength(password)
-                        emoji = "🟢" if strength == 'strong' else "🟡" if strength == 'medium' else "🔴"
+                        emoji = self._STRENGTH_EMOJI.get(strength, '⚪')
                         print(f"\n{i:2d}. {emoji} {password}")
                     
                     print(f"\n✅ Generated {len(passwords)} passwords")
@@ -820,6 +914,105 @@ class PasswordGenerator:
                 input("\nPress Enter to continue...")
 
 
+@functools.lru_cache(maxsize=1024)
+def _analyze(password: str) -> Tuple:
+    """
+    Analyze one password; memoized because every generated password is
+    scored at least twice (history bookkeeping plus display).
+
+    Returns an immutable tuple of (score, strength, entropy, has_lower,
+    has_upper, has_digit, has_symbol, issues, suggestions).
+    """
+    score = 0
+    issues = []
+    suggestions = []
+
+    # Check length
+    if len(password) >= 12:
+        score += 3
+    elif len(password) >= 8:
+        score += 2
+    elif len(password) >= 6:
+        score += 1
+    else:
+        issues.append("Password is too short (minimum 6 characters)")
+
+    # Check character variety: one translate pass classifies every
+    # character, then four bit tests replace four full scans
+    classes = password.encode('latin-1', 'replace').translate(_CLASS_TABLE)
+    mask = functools.reduce(operator.or_, classes, 0)
+    has_lower = bool(mask & 1)
+    has_upper = bool(mask & 2)
+    has_digit = bool(mask & 4)
+    has_symbol = bool(mask & 8)
+
+    char_types = (mask & 1) + ((mask >> 1) & 1) + ((mask >> 2) & 1) + ((mask >> 3) & 1)
+
+    if char_types >= 4:
+        score += 3
+    elif char_types >= 3:
+        score += 2
+    elif char_types >= 2:
+        score += 1
+    else:
+        issues.append("Use more character types (lowercase, uppercase, digits, symbols)")
+
+    # Check for common patterns
+    if password.lower() in PasswordGenerator.COMMON_PASSWORDS:
+        score = 0
+        issues.append("Password is too common")
+
+    # Check for sequences
+    if _RE_SEQ3.search(password):
+        issues.append("Contains sequential numbers")
+        score -= 1
+
+    # Check for repeated characters
+    if _RE_REPEAT3.search(password):
+        issues.append("Contains repeated characters")
+        score -= 1
+
+    # Calculate entropy (rough estimate)
+    charset_size = 0
+    if has_lower:
+        charset_size += 26
+    if has_upper:
+        charset_size += 26
+    if has_digit:
+        charset_size += 10
+    if has_symbol:
+        charset_size += len(PasswordGenerator.CHARACTER_SETS['symbols'])
+
+    # Shannon entropy in bits: length * log2(alphabet size)
+    entropy = len(password) * _LOG2_TABLE[charset_size]
+
+    # Determine strength level
+    if score >= 5:
+        strength = "Very Strong" if entropy > 80 else "Strong"
+    elif score >= 3:
+        strength = "Medium"
+    elif score >= 1:
+        strength = "Weak"
+    else:
+        strength = "Very Weak"
+
+    # Add suggestions
+    if not has_lower:
+        suggestions.append("Add lowercase letters")
+    if not has_upper:
+        suggestions.append("Add uppercase letters")
+    if not has_digit:
+        suggestions.append("Add digits")
+    if not has_symbol:
+        suggestions.append("Add symbols")
+    if len(password) < 12:
+        suggestions.append("Make password longer (at least 12 characters)")
+
+    return (min(max(score, 0), 6), strength, round(entropy, 2),
+            has_lower, has_upper, has_digit, has_symbol,
+            tuple(issues), tuple(suggestions))
+
+
 def main():
     """Main function to run the password generator."""
     try:
@@ -4,12 +4,37 @@ Currency Converter
 A professional currency converter with static exchange rates.
 """
 
+import bisect
+import functools
 import os
 import sys
 import json
+import time
+from collections import deque
 from datetime import datetime
+from itertools import islice
 from typing import Dict, List, Tuple, Optional
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Clearing via ANSI escape avoids forking a shell for clear/cls on
+# every screen; Windows consoles without VT support keep the old path
+_CLEAR_ANSI = "\x1b[2J\x1b[H"
+_USE_ANSI = os.name != 'nt'
+
+
+@functools.lru_cache(maxsize=1024)
+def _format(amount: float, symbol: str, no_decimal: bool) -> str:
+    """Format an amount with its symbol; cached on primitive keys."""
+    if no_decimal:
+        return f"{symbol}{amount:,.0f}"
+    return f"{symbol}{amount:,.2f}"
+
 
 class CurrencyConverter:
     """Main currency converter class with static exchange rates."""
@@ -96,13 +121,63 @@ class CurrencyConverter:
     
     def __init__(self):
         """Initialize the currency converter."""
-        self.conversion_history = []
+        # Bounded so a long session can't grow history without limit;
+        # old entries are evicted automatically
+        self.conversion_history = deque(maxlen=10_000)
         self.base_currency = 'USD'
         self.last_updated = '2024-01-15'  # Static date since rates are fixed
+        # Clearing only makes sense on a real terminal (and keeps piped
+        # output readable)
+        self._is_tty = sys.stdout.isatty()
+        # Rates are static, so every pairwise rate can be computed once
+        # here; conversions then cost one dict lookup with no division
+        self._rate_matrix = {
+            (a, b): r_b / r_a
+            for a, r_a in self.EXCHANGE_RATES.items()
+            for b, r_b in self.EXCHANGE_RATES.items()
+        }
+        # Flattened lookups for format_currency so the cached formatter
+        # can be keyed on hashable primitives
+        self._symbols = {
+            code: info['symbol'] for code, info in self.CURRENCY_INFO.items()
+        }
+        self._no_decimal = frozenset({'JPY', 'KRW', 'IDR', 'VND'})
+        # Sorted once here instead of on every invalid input / listing
+        self._sorted_codes = sorted(self.EXCHANGE_RATES)
+        self._sorted_codes_str = ', '.join(self._sorted_codes)
+        # Dense float64 copy of the rate matrix for batch conversions
+        self._codes = tuple(self.EXCHANGE_RATES)
+        self._code_index = {code: i for i, code in enumerate(self._codes)}
+        rates_np = np.fromiter(
+            self.EXCHANGE_RATES.values(), dtype=np.float64, count=len(self._codes)
+        )
+        self._matrix_np = rates_np[None, :] / rates_np[:, None]
+        # Rates are static, so their display strings never change either
+        self._formatted_rates = {
+            code: self._fmt_rate(rate)
+            for code, rate in self.EXCHANGE_RATES.items()
+        }
         
+    # More decimal places for smaller rates; thresholds and format specs
+    # line up so bisect picks the right precision without branching
+    _RATE_THRESHOLDS = (1, 10, 100, 1000)
+    _RATE_FORMATS = ("{:,.4f}", "{:,.3f}", "{:,.2f}", "{:,.1f}", "{:,.0f}")
+
+    @classmethod
+    def _fmt_rate(cls, rate: float) -> str:
+        """Format a rate with precision scaled to its magnitude."""
+        spec = cls._RATE_FORMATS[bisect.bisect_left(cls._RATE_THRESHOLDS, rate)]
+        return spec.format(rate)
+
     def clear_screen(self) -> None:
         """Clear the terminal screen."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if not self._is_tty:
+            return
+        if _USE_ANSI:
+            sys.stdout.write(_CLEAR_ANSI)
+            sys.stdout.flush()
+        else:
+            os.system('cls')
     
     def display_banner(self) -> None:
         """Display the application banner."""
@@ -154,18 +229,10 @@ class CurrencyConverter:
         Returns:
             Formatted currency string
         """
-        currency_info = self.CURRENCY_INFO.get(currency_code, {})
-        symbol = currency_info.get('symbol', currency_code)
-        
-        # Different formatting for different currencies
-        if currency_code in ['JPY', 'KRW', 'IDR', 'VND']:
-            # No decimal places for these currencies
-            formatted = f"{symbol}{amount:,.0f}"
-        else:
-            # Two decimal places for most currencies
-            formatted = f"{symbol}{amount:,.2f}"
-        
-        return formatted
+        symbol = self._symbols.get(currency_code, currency_code)
+        # JPY-style currencies take no decimal places; the cached helper
+        # does the actual formatting
+        return _format(amount, symbol, currency_code in self._no_decimal)
     
     def get_valid_currency_code(self, prompt: str) -> str:
         """
@@ -182,7 +249,7 @@ class CurrencyConverter:
             if code in self.EXCHANGE_RATES:
                 return code
             else:
-                print(f"❌ Invalid currency code. Available codes: {', '.join(sorted(self.EXCHANGE_RATES.keys()))}")
+                print(f"❌ Invalid currency code. Available codes: {self._sorted_codes_str}")
     
     def get_valid_amount(self, prompt: str) -> float:
         """
@@ -226,14 +293,30 @@ class CurrencyConverter:
         """
         if from_currency == to_currency:
             return amount
-        
-        # Convert to USD first, then to target currency
-        # Rate stored as: 1 USD = X foreign currency
-        amount_in_usd = amount / self.EXCHANGE_RATES[from_currency]
-        converted_amount = amount_in_usd * self.EXCHANGE_RATES[to_currency]
-        
-        return converted_amount
-    
+
+        return amount * self._rate_matrix[(from_currency, to_currency)]
+
+    def convert_many(self, amounts, from_codes, to_codes) -> np.ndarray:
+        """
+        Convert many amounts in one vectorized pass.
+
+        Args:
+            amounts: Sequence or array of amounts to convert
+            from_codes: Source currency code per amount
+            to_codes: Target currency code per amount
+
+        Returns:
+            Array of converted amounts
+        """
+        amounts = np.asarray(amounts, dtype=np.float64)
+        fi = np.fromiter(
+            (self._code_index[c] for c in from_codes), np.intp, count=len(amounts)
+        )
+        ti = np.fromiter(
+            (self._code_index[c] for c in to_codes), np.intp, count=len(amounts)
+        )
+        return amounts * self._matrix_np[fi, ti]
+
     def display_conversion(self, amount: float, from_currency: str, 
                           to_currency: str, result: float) -> None:
         """
@@ -290,24 +373,26 @@ class CurrencyConverter:
         """
         if from_currency == to_currency:
             return 1.0
-        
-        # Rate stored as: 1 USD = X foreign currency
-        from_rate = self.EXCHANGE_RATES[from_currency]
-        to_rate = self.EXCHANGE_RATES[to_currency]
-        
-        # 1 FROM = (1/from_rate) USD = (1/from_rate) * to_rate TO
-        return to_rate / from_rate
+
+        return self._rate_matrix[(from_currency, to_currency)]
     
     def add_to_history(self, amount: float, from_currency: str, 
                       to_currency: str, result: float) -> None:
         """Add conversion to history."""
         entry = {
-            'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            # Raw epoch seconds; formatted lazily when history is shown
+            # or exported, so each conversion pays only a clock read
+            'timestamp': time.time(),
             'amount': amount,
             'from_currency': from_currency,
             'to_currency': to_currency,
             'result': result,
-            'rate': self.get_exchange_rate(from_currency, to_currency)
+            # The rate is already implied by the conversion itself; no
+            # need to look it up again (and it's exactly 1 when the
+            # currencies match)
+            'rate': 1.0 if from_currency == to_currency
+                    else result / amount if amount
+                    else self.get_exchange_rate(from_currency, to_currency)
         }
         self.conversion_history.append(entry)
     
@@ -345,8 +430,8 @@ class CurrencyConverter:
         Args:
             items_per_line: Number of currencies per line
         """
-        currencies = sorted(self.EXCHANGE_RATES.keys())
-        
+        currencies = self._sorted_codes
+
         for i, currency in enumerate(currencies, 1):
             info = self.CURRENCY_INFO.get(currency, {})
             flag = info.get('flag', '')
@@ -365,97 +450,80 @@ class CurrencyConverter:
     def display_all_rates(self) -> None:
         """Display all exchange rates relative to base currency."""
         self.clear_screen()
-        print("\n" + "═" * 70)
-        print("📊 ALL EXCHANGE RATES (Base: USD)")
-        print("═" * 70)
-        print(f"\nLast updated: {self.last_updated}")
-        print(f"Base currency: {self.CURRENCY_INFO['USD']['flag']} USD (US Dollar)")
-        print("\n" + "─" * 70)
-        
-        # Sort currencies alphabetically
-        sorted_currencies = sorted(self.EXCHANGE_RATES.items(), key=lambda x: x[0])
-        
-        print(f"\n{'Currency':<10} {'Flag':<5} {'Name':<20} {'Rate (1 USD =)':>20} {'Symbol':<10}")
-        print("-" * 70)
-        
-        for currency_code, rate in sorted_currencies:
+        # Accumulate the whole table and write it in one go instead of
+        # one print (and potential flush) per row
+        parts = [
+            "\n" + "═" * 70,
+            "📊 ALL EXCHANGE RATES (Base: USD)",
+            "═" * 70,
+            f"\nLast updated: {self.last_updated}",
+            f"Base currency: {self.CURRENCY_INFO['USD']['flag']} USD (US Dollar)",
+            "\n" + "─" * 70,
+            f"\n{'Currency':<10} {'Flag':<5} {'Name':<20} {'Rate (1 USD =)':>20} {'Symbol':<10}",
+            "-" * 70,
+        ]
+
+        for currency_code in self._sorted_codes:
             info = self.CURRENCY_INFO.get(currency_code, {})
             flag = info.get('flag', '')
             name = info.get('name', 'Unknown')
             symbol = info.get('symbol', '')
-            
-            # Format rate based on value
-            if rate > 1000:
-                formatted_rate = f"{rate:,.0f}"
-            elif rate > 100:
-                formatted_rate = f"{rate:,.1f}"
-            elif rate > 10:
-                formatted_rate = f"{rate:,.2f}"
-            elif rate > 1:
-                formatted_rate = f"{rate:,.3f}"
-            else:
-                formatted_rate = f"{rate:,.4f}"
-            
-            print(f"{currency_code:<10} {flag:<5} {name:<20} {formatted_rate:>20} {symbol:<10}")
-        
-        print("\n" + "═" * 70)
+
+            formatted_rate = self._formatted_rates[currency_code]
+
+            parts.append(f"{currency_code:<10} {flag:<5} {name:<20} {formatted_rate:>20} {symbol:<10}")
+
+        parts.append("\n" + "═" * 70)
+        sys.stdout.write("\n".join(parts) + "\n")
         input("\nPress Enter to continue...")
     
-    def display_popular_pairs(self) -> None:
-        """Display popular currency pairs with rates."""
-        self.clear_screen()
-        print("\n" + "═" * 60)
-        print("📈 POPULAR CURRENCY PAIRS")
-        print("═" * 60)
-        print(f"\nLast updated: {self.last_updated}")
-        print("\n" + "─" * 60)
-        
-        print(f"\n{'Pair':<12} {'Rate':<20} {'Inverse':<20}")
-        print("-" * 60)
-        
+    @functools.cached_property
+    def _popular_pairs_table(self) -> str:
+        """Fully rendered popular-pairs screen.
+
+        Rates never change at runtime, so the whole table (example line
+        included) is rendered once on first access and reused.
+        """
+        parts = [
+            "\n" + "═" * 60,
+            "📈 POPULAR CURRENCY PAIRS",
+            "═" * 60,
+            f"\nLast updated: {self.last_updated}",
+            "\n" + "─" * 60,
+            f"\n{'Pair':<12} {'Rate':<20} {'Inverse':<20}",
+            "-" * 60,
+        ]
+
         for from_curr, to_curr in self.POPULAR_PAIRS:
             rate = self.get_exchange_rate(from_curr, to_curr)
-            inverse_rate = 1 / rate
-            
-            # Format rates nicely
-            if rate > 1000:
-                rate_str = f"{rate:,.0f}"
-            elif rate > 100:
-                rate_str = f"{rate:,.1f}"
-            elif rate > 10:
-                rate_str = f"{rate:,.2f}"
-            elif rate > 1:
-                rate_str = f"{rate:,.3f}"
-            else:
-                rate_str = f"{rate:,.4f}"
-            
-            if inverse_rate > 1000:
-                inverse_str = f"{inverse_rate:,.0f}"
-            elif inverse_rate > 100:
-                inverse_str = f"{inverse_rate:,.1f}"
-            elif inverse_rate > 10:
-                inverse_str = f"{inverse_rate:,.2f}"
-            elif inverse_rate > 1:
-                inverse_str = f"{inverse_rate:,.3f}"
-            else:
-                inverse_str = f"{inverse_rate:,.4f}"
+            # Identity pairs need no division for the inverse
+            inverse_rate = 1.0 if from_curr == to_curr else 1 / rate
             
+            rate_str = self._fmt_rate(rate)
+            inverse_str = self._fmt_rate(inverse_rate)
+
             from_info = self.CURRENCY_INFO.get(from_curr, {})
             to_info = self.CURRENCY_INFO.get(to_curr, {})
             from_flag = from_info.get('flag', '')
             to_flag = to_info.get('flag', '')
             
-            print(f"{from_flag}{from_curr}/{to_flag}{to_curr:<8} 1 {from_curr} = {rate_str:<15} {to_curr} 1 {to_curr} = {inverse_str:<15} {from_curr}")
-        
-        print("\n" + "═" * 60)
-        
+            parts.append(f"{from_flag}{from_curr}/{to_flag}{to_curr:<8} 1 {from_curr} = {rate_str:<15} {to_curr} 1 {to_curr} = {inverse_str:<15} {from_curr}")
+
+        parts.append("\n" + "═" * 60)
+
         # Quick conversion example
-        print("\n💡 Quick Example:")
         usd_to_eur = self.convert_currency(100, 'USD', 'EUR')
         formatted_usd = self.format_currency(100, 'USD')
         formatted_eur = self.format_currency(usd_to_eur, 'EUR')
-        print(f"{formatted_usd} = {formatted_eur}")
-        
+        parts.append("\n💡 Quick Example:")
+        parts.append(f"{formatted_usd} = {formatted_eur}")
+
+        return "\n".join(parts)
+
+    def display_popular_pairs(self) -> None:
+        """Display popular currency pairs with rates."""
+        self.clear_screen()
+        sys.stdout.write(self._popular_pairs_table + "\n")
         input("\nPress Enter to continue...")
     
     def display_currency_info(self) -> None:
@@ -473,40 +541,31 @@ class CurrencyConverter:
         self.clear_screen()
         info = self.CURRENCY_INFO.get(currency_code, {})
         rate = self.EXCHANGE_RATES.get(currency_code, 0)
-        
-        print("\n" + "═" * 60)
-        print(f"{info.get('flag', '')} {currency_code} - {info.get('name', 'Unknown')}")
-        print("═" * 60)
-        
-        print(f"\nSymbol: {info.get('symbol', 'N/A')}")
-        print(f"Exchange rate: 1 USD = {rate:.4f} {currency_code}")
-        print(f"Inverse rate: 1 {currency_code} = {1/rate:.6f} USD")
-        
-        # Show conversions to other major currencies
-        print("\n" + "─" * 40)
-        print("💱 CONVERSIONS (1 unit):")
-        print("-" * 40)
-        
+
+        parts = [
+            "\n" + "═" * 60,
+            f"{info.get('flag', '')} {currency_code} - {info.get('name', 'Unknown')}",
+            "═" * 60,
+            f"\nSymbol: {info.get('symbol', 'N/A')}",
+            f"Exchange rate: 1 USD = {rate:.4f} {currency_code}",
+            f"Inverse rate: 1 {currency_code} = {1/rate:.6f} USD",
+            "\n" + "─" * 40,
+            "💱 CONVERSIONS (1 unit):",
+            "-" * 40,
+        ]
+
         major_currencies = ['USD', 'EUR', 'GBP', 'JPY', 'CAD', 'AUD', 'CHF']
         for other_currency in major_currencies:
             if other_currency != currency_code:
                 rate_to_other = self.get_exchange_rate(currency_code, other_currency)
                 other_info = self.CURRENCY_INFO.get(other_currency, {})
-                
-                if rate_to_other > 1000:
-                    rate_str = f"{rate_to_other:,.0f}"
-                elif rate_to_other > 100:
-                    rate_str = f"{rate_to_other:,.1f}"
-                elif rate_to_other > 10:
-                    rate_str = f"{rate_to_other:,.2f}"
-                elif rate_to_other > 1:
-                    rate_str = f"{rate_to_other:,.3f}"
-                else:
-                    rate_str = f"{rate_to_other:,.4f}"
-                
-                print(f"1 {currency_code} = {rate_str} {other_info.get('flag', '')}{other_currency}")
-        
-        print("\n" + "═" * 60)
+
+                rate_str = self._fmt_rate(rate_to_other)
+
+                parts.append(f"1 {currency_code} = {rate_str} {other_info.get('flag', '')}{other_currency}")
+
+        parts.append("\n" + "═" * 60)
+        sys.stdout.write("\n".join(parts) + "\n")
         input("\nPress Enter to continue...")
     
     def display_conversion_history(self) -> None:
@@ -523,15 +582,18 @@ class CurrencyConverter:
             print(f"\nTotal conversions: {len(self.conversion_history)}")
             print("\n" + "─" * 70)
             
-            # Show last 10 conversions
-            for i, entry in enumerate(reversed(self.conversion_history[-10:]), 1):
+            # Show last 10 conversions; reversed() on a deque is O(1) to
+            # start, so this touches only the entries actually shown
+            for i, entry in enumerate(islice(reversed(self.conversion_history), 10), 1):
                 from_amount = self.format_currency(entry['amount'], entry['from_currency'])
                 to_amount = self.format_currency(entry['result'], entry['to_currency'])
                 
                 from_info = self.CURRENCY_INFO.get(entry['from_currency'], {})
                 to_info = self.CURRENCY_INFO.get(entry['to_currency'], {})
                 
-                print(f"\n{i:2d}. {entry['timestamp']}")
+                timestamp = datetime.fromtimestamp(
+                    entry['timestamp']).isoformat(' ', 'seconds')
+                print(f"\n{i:2d}. {timestamp}")
                 print(f"    {from_info.get('flag', '')} {from_amount} → {to_info.get('flag', '')} {to_amount}")
                 print(f"    Rate: 1 {entry['from_currency']} = {entry['rate']:.6f} {entry['to_currency']}")
         
@@ -567,11 +629,22 @@ class CurrencyConverter:
                     'base_currency': self.base_currency,
                     'last_updated': self.last_updated
                 },
-                'conversions': self.conversion_history
+                'conversions': [
+                    {**entry, 'timestamp': datetime.fromtimestamp(
+                        entry['timestamp']).isoformat(' ', 'seconds')}
+                    for entry in self.conversion_history
+                ]
             }
             
-            with open(filename, 'w') as f:
-                json.dump(data, f, indent=2)
+            if orjson is not None:
+                with open(filename, 'wb', buffering=1 << 20) as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                # Stream the encoding in chunks so a large history never
+                # needs the whole serialized document in memory at once
+                with open(filename, 'w', buffering=1 << 20) as f:
+                    for chunk in json.JSONEncoder(indent=2).iterencode(data):
+                        f.write(chunk)
             
             print(f"✅ Saved {len(self.conversion_history)} conversions to '{filename}'")
             